@@ -36,6 +36,10 @@ def setup_path():
 # 在任何导入之前设置路径
 setup_path()
 
+# 打包后多进程子进程（如并行解析XML）在此处接管并退出，不会继续启动界面
+import multiprocessing
+multiprocessing.freeze_support()
+
 
 def check_integrity():
     """启动前进行完整性校验"""
@@ -9,7 +9,8 @@ import sys
 import json
 import shutil
 import logging
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
@@ -46,6 +47,7 @@ class AutoPackManager:
         self.config_file = config_file
         
         self.pending_list = []  # 待封包列表
+        self._with_target_count = 0  # 已设置目标路径的项目数（随增删改原地更新）
         
         # 确保目录存在
         os.makedirs(self.autopack_dir, exist_ok=True)
@@ -60,9 +62,14 @@ class AutoPackManager:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     config = json.load(f)
                     self.pending_list = config.get('pending_list', [])
+                # 旧配置没有显示用时间，加载时一次性补齐
+                for item in self.pending_list:
+                    if 'added_time_display' not in item:
+                        item['added_time_display'] = str(item.get('added_time', ''))[:19].replace('T', ' ')
         except Exception as e:
             logger.warning(f"加载自动封包配置失败: {str(e)}")
             self.pending_list = []
+        self._recount_statistics()
     
     def save_config(self):
         """保存自动封包配置"""
@@ -110,7 +117,7 @@ class AutoPackManager:
                 'matbin_file': matbin_file,
                 'original_path': original_matbin_path,
                 'target_path': '',  # 用户指定的封包路径
-                'added_time': datetime.now().isoformat(),
+                **self._added_time_fields(),
                 'filename': os.path.basename(matbin_file)
             }
             
@@ -151,7 +158,7 @@ class AutoPackManager:
             'matbin_file': '',  # 执行封包时生成
             'original_path': '',
             'target_path': '',  # 用户指定的封包路径
-            'added_time': datetime.now().isoformat(),
+            **self._added_time_fields(),
         }
         
         self.pending_list.append(pack_item)
@@ -160,27 +167,51 @@ class AutoPackManager:
         logger.info(f"已添加材质到自动封包: ID={material_id}, 名称={material_name}")
     
     def get_statistics(self) -> Dict[str, int]:
-        """获取统计信息"""
+        """获取统计信息（使用缓存计数，O(1)）"""
+        total = len(self.pending_list)
         return {
-            'total_pending': len(self.pending_list),
-            'with_target_path': len([item for item in self.pending_list if item.get('target_path')]),
-            'without_target_path': len([item for item in self.pending_list if not item.get('target_path')])
+            'total_pending': total,
+            'with_target_path': self._with_target_count,
+            'without_target_path': total - self._with_target_count
         }
     
+    def _recount_statistics(self):
+        """全量重算已设置目标路径的项目数（仅在整体加载列表时调用）"""
+        self._with_target_count = sum(1 for item in self.pending_list if item.get('target_path'))
+    
     def update_target_path(self, item_ids: List[int], target_path: str):
         """更新目标路径"""
+        item_ids = set(item_ids)
         for item in self.pending_list:
             if item['id'] in item_ids:
+                self._with_target_count += bool(target_path) - bool(item.get('target_path'))
                 item['target_path'] = target_path
         self.save_config()
     
     def remove_from_pending(self, item_ids: List[int]):
         """从待封包列表中移除项目"""
-        self.pending_list = [item for item in self.pending_list if item['id'] not in item_ids]
+        item_ids = set(item_ids)
+        kept = []
+        for item in self.pending_list:
+            if item['id'] in item_ids:
+                if item.get('target_path'):
+                    self._with_target_count -= 1
+            else:
+                kept.append(item)
+        self.pending_list = kept
         # 删除后重新排序ID
         self._reorder_ids()
         self.save_config()
     
+    @staticmethod
+    def _added_time_fields() -> Dict[str, str]:
+        """生成添加时间字段（ISO时间 + 预先截取好的显示文本）"""
+        now = datetime.now()
+        return {
+            'added_time': now.isoformat(),
+            'added_time_display': now.strftime('%Y-%m-%d %H:%M:%S'),
+        }
+    
     def _get_next_id(self) -> int:
         """获取下一个可用的ID（从1开始顺序递增）"""
         if not self.pending_list:
@@ -294,13 +325,15 @@ class AutoPackManager:
         if items_updated:
             self.save_config()
 
-    def execute_autopack(self, base_pack_dir: str, selected_ids: List[int] = None) -> Dict[str, any]:
+    def execute_autopack(self, base_pack_dir: str, selected_ids: List[int] = None,
+                         progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, any]:
         """
         执行自动封包（使用多线程优化）
         
         Args:
             base_pack_dir: 基础封包目录
             selected_ids: 要封包的项目ID列表，如果为None则封包所有项目
+            progress_callback: 复制进度回调 (已完成数, 总数)，在工作线程中调用
             
         Returns:
             封包结果信息
@@ -356,11 +389,11 @@ class AutoPackManager:
                     path_groups[target_path] = []
                 path_groups[target_path].append(item)
             
-            # 执行封包 - 按目标路径分组处理
+            # 执行封包 - 先创建各分组目标目录，再并发复制文件
             total_packed = 0
             total_failed = 0
+            copy_tasks = []
             
-            # 处理每个路径分组
             for target_path, items in path_groups.items():
                 # 创建目标目录
                 if target_path:
@@ -370,26 +403,29 @@ class AutoPackManager:
                     
                 os.makedirs(full_target_path, exist_ok=True)
                 logger.info(f"处理目标路径: {target_path}, 完整路径: {full_target_path}")
+                copy_tasks.extend((item, full_target_path, target_path) for item in items)
+            
+            total_tasks = len(copy_tasks)
+            packed_ids = set()
+            max_workers = max(1, min(total_tasks, os.cpu_count() or 4))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_task = {
+                    executor.submit(self._copy_matbin_file, item, full_target_path): (item, target_path)
+                    for item, full_target_path, target_path in copy_tasks
+                }
                 
-                # 复制当前分组的matbin文件到目标目录
-                matbin_files_copied = []
-                for item in items:
+                for done, future in enumerate(as_completed(future_to_task), 1):
+                    item, target_path = future_to_task[future]
                     try:
-                        source_file = item.get('matbin_file', '')
-                        
-                        # 检查是否有有效的matbin文件
-                        if not source_file:
-                            raise ValueError(f"材质 {item.get('filename', '未知')} 尚未生成MATBIN文件，请检查数据库导出是否成功")
-                        
-                        target_file = os.path.join(full_target_path, item.get('filename', os.path.basename(source_file)))
-                        
-                        if os.path.exists(source_file):
-                            shutil.copy2(source_file, target_file)
-                            matbin_files_copied.append(target_file)
-                            logger.info(f"文件复制成功: {source_file} -> {target_file}")
-                        else:
-                            raise FileNotFoundError(f"源文件不存在: {source_file}")
-                            
+                        target_file = future.result()
+                        result['packed_files'].append({
+                            'source': item['matbin_file'],
+                            'target': target_file,
+                            'xml_file': item['xml_file'],
+                            'target_path': target_path
+                        })
+                        packed_ids.add(item['id'])
+                        total_packed += 1
                     except Exception as e:
                         result['failed_files'].append({
                             'filename': item.get('filename', '未知'),
@@ -397,19 +433,11 @@ class AutoPackManager:
                         })
                         total_failed += 1
                         logger.error(f"文件复制失败: {item.get('matbin_file', '未知')} - {str(e)}")
-                        continue
-                
-                # 记录当前分组的成功文件
-                for copied_file in matbin_files_copied:
-                    result['packed_files'].append({
-                        'source': item['matbin_file'],
-                        'target': copied_file,
-                        'xml_file': item['xml_file'],
-                        'target_path': target_path
-                    })
-                
-                total_packed += len(matbin_files_copied)
-                logger.info(f"路径分组 '{target_path}': 成功复制 {len(matbin_files_copied)} 个文件")
+                    
+                    if progress_callback:
+                        progress_callback(done, total_tasks)
+            
+            logger.info(f"文件复制完成: 成功 {total_packed}, 失败 {total_failed}")
             
             # 如果有文件成功复制，使用WitchyBND对整个基础目录进行BND封包
             if total_packed > 0:
@@ -436,9 +464,7 @@ class AutoPackManager:
             
             # 清理已成功封包的项目
             if total_packed > 0:
-                packed_ids = [item['id'] for item in items_to_pack 
-                             if any(pf['source'] == item['matbin_file'] for pf in result['packed_files'])]
-                self.remove_from_pending(packed_ids)
+                self.remove_from_pending(list(packed_ids))
             
             logger.info(f"自动封包完成: 成功 {total_packed}, 失败 {total_failed}")
             
@@ -448,6 +474,22 @@ class AutoPackManager:
         
         return result
     
+    def _copy_matbin_file(self, item: Dict, full_target_path: str) -> str:
+        """复制单个项目的matbin文件到目标目录，返回目标文件路径"""
+        source_file = item.get('matbin_file', '')
+        
+        # 检查是否有有效的matbin文件
+        if not source_file:
+            raise ValueError(f"材质 {item.get('filename', '未知')} 尚未生成MATBIN文件，请检查数据库导出是否成功")
+        
+        if not os.path.exists(source_file):
+            raise FileNotFoundError(f"源文件不存在: {source_file}")
+        
+        target_file = os.path.join(full_target_path, item.get('filename', os.path.basename(source_file)))
+        shutil.copy2(source_file, target_file)
+        logger.info(f"文件复制成功: {source_file} -> {target_file}")
+        return target_file
+    
     def _create_bnd_package(self, source_dir: str, target_name: str) -> Optional[str]:
         """
         使用WitchyBND将基础目录重新打包为BND文件
@@ -6,18 +6,102 @@
 
 import sqlite3
 import os
+import re
 import json
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Tuple, Sequence, Iterable
 from datetime import datetime
 
 # 导入资源路径辅助模块
 from src.utils.resource_path import get_database_path
 
-# 配置日志
+# 调试开关：开启后输出搜索/导入过程的详细调试日志
+DEBUG = False
+
+# 配置日志（关闭调试时 logger.debug 在格式化参数前即返回）
 logger = logging.getLogger(__name__)
-# 临时设置为DEBUG级别进行调试
-logging.basicConfig(level=logging.DEBUG, format='%(levelname)s:%(name)s:%(message)s')
+logging.basicConfig(level=logging.DEBUG if DEBUG else logging.INFO,
+                    format='%(levelname)s:%(name)s:%(message)s')
+
+# search_materials 关键字匹配的字段
+KEYWORD_SEARCH_FIELDS = ('filename', 'file_name', 'shader_path', 'source_path')
+
+
+def search_keyword_term(keyword: str) -> str:
+    """返回关键字实际用于匹配的部分（输入完整路径时只取文件名部分）"""
+    if '\\' in keyword or '/' in keyword:
+        filename_part = keyword.replace('\\', '/').rpartition('/')[2]
+        if filename_part:
+            return filename_part
+    return keyword
+
+
+# 拼接搜索文本时的字段分隔符（通配符不会跨越它匹配）
+_BLOB_SEPARATOR = '\x01'
+
+# 只转换 ASCII 大写字母的小写映射（与 SQLite LIKE 的大小写规则一致）
+_ASCII_LOWER = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+# 十进制数值字符串（整数、小数、科学计数法）
+_FLOAT_RE = re.compile(r'^[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?$')
+
+
+def _try_float(value: Any) -> Optional[float]:
+    """转换为 float；空值或无法解析时返回 None（先用正则预检，不走异常路径）"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    return float(value) if value and _FLOAT_RE.match(value) else None
+
+
+def material_search_blob(material: Dict[str, Any]) -> str:
+    """把材质的全部关键字字段拼成一个搜索文本（每个材质只需生成一次，已转为 ASCII 小写）"""
+    return _BLOB_SEPARATOR.join(
+        material.get(f) or '' for f in KEYWORD_SEARCH_FIELDS
+    ).translate(_ASCII_LOWER)
+
+
+def like_pattern_regex(term: str) -> 're.Pattern[str]':
+    """
+    把 LIKE '%term%' 转换为在搜索文本上使用的等价正则表达式
+    
+    LIKE 中 % 和 _ 是通配符，且只对 ASCII 字母忽略大小写；
+    通配符不匹配字段分隔符，相当于对各字段分别 LIKE 后取 OR
+    """
+    pattern = ''.join(
+        f'[^{_BLOB_SEPARATOR}]*' if c == '%'
+        else f'[^{_BLOB_SEPARATOR}]' if c == '_'
+        else re.escape(c)
+        for c in term
+    )
+    return re.compile(pattern, re.IGNORECASE | re.ASCII)
+
+
+def filter_materials_by_term(materials: List[Dict[str, Any]], blobs: List[str],
+                             term: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    在已有搜索结果中按关键字再次筛选，匹配规则与 search_materials 的 LIKE 一致
+    
+    Args:
+        materials: 上次的搜索结果
+        blobs: 与 materials 一一对应的搜索文本（material_search_blob）
+        term: 关键字
+        
+    Returns:
+        (筛选后的材质列表, 对应的搜索文本列表)
+    """
+    if '%' in term or '_' in term:
+        search = like_pattern_regex(term).search
+        hits = [i for i, blob in enumerate(blobs) if search(blob)]
+    else:
+        # 不含通配符：搜索文本已是小写，直接做子串查找
+        needle = term.translate(_ASCII_LOWER)
+        hits = [i for i, blob in enumerate(blobs) if needle in blob]
+    return [materials[i] for i in hits], [blobs[i] for i in hits]
+
 
 class MaterialDatabase:
     """材质数据库管理类"""
@@ -40,6 +124,19 @@ class MaterialDatabase:
         # 初始化数据库
         self._init_database()
     
+    def _connect(self, **kwargs) -> sqlite3.Connection:
+        """
+        打开数据库连接
+        
+        数据库使用 WAL 日志（在初始化时设置，持久保存在文件中），
+        WAL 模式下 synchronous=NORMAL 只在检查点时同步磁盘，
+        写入吞吐量明显提高，且程序崩溃不会损坏数据库
+        """
+        conn = sqlite3.connect(self.db_path, **kwargs)
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+    
     def _init_database(self):
         """初始化数据库表结构"""
         try:
@@ -60,9 +157,15 @@ class MaterialDatabase:
                     os.makedirs(db_dir, exist_ok=True)
                     logger.info(f"创建数据库目录: {db_dir}")
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
+                # 切换到 WAL 日志模式（持久设置，只需执行一次）
+                try:
+                    cursor.execute("PRAGMA journal_mode = WAL")
+                except sqlite3.Error as e:
+                    logger.warning(f"启用WAL模式失败: {str(e)}")
+                
                 # 创建材质库表
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS material_libraries (
@@ -154,6 +257,8 @@ class MaterialDatabase:
                 
                 # 搜索优化索引
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_materials_shader ON materials(shader_path)')
+                # 按库筛选并按文件名排序（材质列表的主查询）可直接按索引顺序读取，无需临时排序
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_materials_library_name ON materials(library_id, filename)')
                 
                 # 添加 display_order 列（如果不存在）- 用于控制库的显示顺序
                 try:
@@ -181,7 +286,7 @@ class MaterialDatabase:
     def create_library(self, name: str, description: str = "", source_path: str = "") -> int:
         """创建新的材质库"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     INSERT INTO material_libraries (name, description, source_path, display_order)
@@ -223,7 +328,7 @@ class MaterialDatabase:
     def get_libraries(self) -> List[Dict[str, Any]]:
         """获取所有材质库"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 cursor.execute('''
@@ -242,7 +347,7 @@ class MaterialDatabase:
     def get_material_count(self, library_id: int) -> int:
         """获取指定库中的材质数量"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT COUNT(*) FROM materials WHERE library_id = ?
@@ -255,6 +360,28 @@ class MaterialDatabase:
             logger.error(f"获取材质数量失败: {str(e)}")
             return 0
     
+    def get_libraries_with_counts(self) -> List[Dict[str, Any]]:
+        """一次查询获取所有材质库及其材质数量（material_count 字段）"""
+        try:
+            with self._connect() as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT l.id, l.name, l.description, l.source_path,
+                           COALESCE(l.display_order, l.id) as display_order,
+                           COUNT(m.id) as material_count
+                    FROM material_libraries l
+                    LEFT JOIN materials m ON m.library_id = l.id
+                    GROUP BY l.id
+                    ORDER BY display_order ASC
+                ''')
+                
+                return [dict(row) for row in cursor.fetchall()]
+                
+        except sqlite3.Error as e:
+            logger.error(f"获取材质库失败: {str(e)}")
+            return []
+    
     def update_library(
         self,
         library_id: int,
@@ -264,7 +391,7 @@ class MaterialDatabase:
     ):
         """更新材质库信息（支持更新 source_path）。"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 updates = []
@@ -298,7 +425,7 @@ class MaterialDatabase:
     def delete_library(self, library_id: int):
         """删除材质库及其所有材质"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # 获取库中所有材质ID
@@ -326,7 +453,7 @@ class MaterialDatabase:
     def swap_library_order(self, library_id_1: int, library_id_2: int):
         """交换两个库的显示顺序"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # 获取两个库的当前顺序
@@ -363,7 +490,7 @@ class MaterialDatabase:
     def reorder_libraries(self):
         """重新整理所有库的 display_order，使其从1开始连续"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # 按当前 display_order 获取所有库
@@ -386,37 +513,68 @@ class MaterialDatabase:
             logger.error(f"重新整理库顺序失败: {str(e)}")
             raise
     
-    def add_materials(self, library_id: int, materials_data: List[Dict[str, Any]], 
-                      progress_callback=None, batch_size: int = 100):
+    @contextmanager
+    def transaction(self, pragmas: Sequence[str] = ()):
+        """
+        显式事务上下文：with 块内的所有写入在同一个事务中提交，出错则整体回滚
+        
+        Args:
+            pragmas: 开启事务前执行的 PRAGMA 语句（部分 PRAGMA 不能在事务内修改）
+        
+        Yields:
+            处于事务中的数据库连接
+        """
+        conn = self._connect(isolation_level=None)
+        try:
+            for pragma in pragmas:
+                conn.execute(pragma)
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+    
+    def add_materials(self, library_id: int, materials_data: Iterable[Dict[str, Any]], 
+                      progress_callback=None, batch_size: int = 100,
+                      total: Optional[int] = None) -> int:
         """
         批量添加材质到指定库（优化版本）
         
-        使用批量插入和事务优化，大幅提升导入速度
+        所有材质在同一个事务中写入，只在结束时提交一次；失败时整体回滚
         
         Args:
             library_id: 目标材质库ID
-            materials_data: 材质数据列表
+            materials_data: 材质数据列表，也可以是边解析边产出的迭代器
             progress_callback: 进度回调函数 callback(current, total, message)
-            batch_size: 批量提交大小，默认100
+            batch_size: 批量写入及进度报告间隔，默认100
+            total: 预计材质数量（materials_data 为迭代器时用于进度显示）
+            
+        Returns:
+            实际写入的材质数量
         """
         try:
-            total = len(materials_data)
+            if total is None:
+                total = len(materials_data)
             logger.info(f"开始批量添加 {total} 个材质到库 {library_id}...")
             
-            with sqlite3.connect(self.db_path) as conn:
-                # 优化 SQLite 性能
-                conn.execute("PRAGMA synchronous = OFF")
-                conn.execute("PRAGMA journal_mode = MEMORY")
-                conn.execute("PRAGMA cache_size = 10000")
+            # 优化 SQLite 性能（需在事务开始前设置；WAL 日志与 synchronous 由 _connect 统一设置）
+            bulk_pragmas = (
+                "PRAGMA cache_size = -65536",
+            )
+            with self.transaction(bulk_pragmas) as conn:
                 cursor = conn.cursor()
                 
                 # 预编译 SQL 语句
                 material_sql = '''
                     INSERT INTO materials (
-                        library_id, file_path, file_name, filename, 
+                        id, library_id, file_path, file_name, filename, 
                         shader_path, source_path, compression, key_value,
                         is_single_import, is_modified
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 '''
                 param_sql = '''
                     INSERT INTO material_params (material_id, name, type, value, key_value, sort_order)
@@ -428,10 +586,39 @@ class MaterialDatabase:
                     ) VALUES (?, ?, ?, ?, ?, ?, ?)
                 '''
                 
+                # 事务已持有写锁，可以预先分配材质ID，从而按批 executemany 插入材质行
+                # （AUTOINCREMENT 表不能复用已删除的ID，需同时参考 sqlite_sequence）
+                cursor.execute("SELECT COALESCE(MAX(id), 0) FROM materials")
+                next_id = cursor.fetchone()[0]
+                cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'materials'")
+                row = cursor.fetchone()
+                if row and row[0] > next_id:
+                    next_id = row[0]
+                next_id += 1
+                
+                materials_batch = []
+                params_data = []
+                samplers_data = []
+                
+                def flush_batch():
+                    if materials_batch:
+                        cursor.executemany(material_sql, materials_batch)
+                        materials_batch.clear()
+                    if params_data:
+                        cursor.executemany(param_sql, params_data)
+                        params_data.clear()
+                    if samplers_data:
+                        cursor.executemany(sampler_sql, samplers_data)
+                        samplers_data.clear()
+                
                 processed = 0
-                for i, material_data in enumerate(materials_data):
-                    # 插入材质基本信息
-                    cursor.execute(material_sql, (
+                for material_data in materials_data:
+                    material_id = next_id
+                    next_id += 1
+                    
+                    # 准备材质基本信息
+                    materials_batch.append((
+                        material_id,
                         library_id,
                         material_data.get('file_path', ''),
                         material_data.get('file_name', ''),
@@ -444,10 +631,7 @@ class MaterialDatabase:
                         material_data.get('is_modified', 0)
                     ))
                     
-                    material_id = cursor.lastrowid
-                    
-                    # 批量准备参数数据
-                    params_data = []
+                    # 准备参数数据
                     for param_index, param in enumerate(material_data.get('params', [])):
                         params_data.append((
                             material_id,
@@ -458,12 +642,7 @@ class MaterialDatabase:
                             param_index
                         ))
                     
-                    # 批量插入参数
-                    if params_data:
-                        cursor.executemany(param_sql, params_data)
-                    
-                    # 批量准备采样器数据
-                    samplers_data = []
+                    # 准备采样器数据
                     for sampler_index, sampler in enumerate(material_data.get('samplers', [])):
                         unk14 = sampler.get('unk14', {})
                         samplers_data.append((
@@ -476,30 +655,22 @@ class MaterialDatabase:
                             sampler_index
                         ))
                     
-                    # 批量插入采样器
-                    if samplers_data:
-                        cursor.executemany(sampler_sql, samplers_data)
-                    
                     processed += 1
                     
-                    # 每 batch_size 个材质提交一次，并报告进度
+                    # 每 batch_size 个材质批量写入一次并报告进度（事务在最后统一提交）
                     if processed % batch_size == 0:
-                        conn.commit()
+                        flush_batch()
                         if progress_callback:
                             progress_callback(processed, total, f"已导入 {processed}/{total} 个材质")
-                        logger.debug(f"批量提交: {processed}/{total}")
-                
-                # 最终提交
-                conn.commit()
-                
-                if progress_callback:
-                    progress_callback(total, total, f"完成导入 {total} 个材质")
-                
-                logger.info(f"成功添加 {total} 个材质到库 {library_id}")
+                        logger.debug("已写入: %d/%d", processed, total)
                 
-        except sqlite3.Error as e:
-            logger.error(f"添加材质失败: {str(e)}")
-            raise
+                flush_batch()
+            
+            if progress_callback:
+                progress_callback(processed, processed, f"完成导入 {processed} 个材质")
+            
+            logger.info(f"成功添加 {processed} 个材质到库 {library_id}")
+            return processed
                 
         except sqlite3.Error as e:
             logger.error(f"添加材质失败: {str(e)}")
@@ -509,13 +680,14 @@ class MaterialDatabase:
                         material_type: str = "", material_path: str = "") -> List[Dict[str, Any]]:
         """搜索材质（支持文件名、路径模糊搜索，自动提取路径中的文件名）"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
-                # 构建基础查询
-                base_query = '''
-                    SELECT DISTINCT m.id, m.library_id, m.file_path, m.file_name, 
+                # 构建基础查询（只有关联采样器表时才可能出现重复行，才需要 DISTINCT）
+                join_samplers = bool(material_type or material_path)
+                base_query = f'''
+                    SELECT {'DISTINCT ' if join_samplers else ''}m.id, m.library_id, m.file_path, m.file_name, 
                            m.filename, m.shader_path, m.source_path, m.compression, 
                            m.key_value, m.created_time, m.is_single_import, m.is_modified,
                            l.name as library_name
@@ -534,13 +706,7 @@ class MaterialDatabase:
                 # 添加关键字条件（增强：支持文件名、shader_path、source_path）
                 if keyword:
                     # 自动提取文件名部分（支持完整路径输入）
-                    import os
-                    search_keyword = keyword
-                    # 如果输入包含路径分隔符，提取文件名部分
-                    if '\\' in keyword or '/' in keyword:
-                        filename_part = os.path.basename(keyword.replace('\\', '/'))
-                        if filename_part:
-                            search_keyword = filename_part
+                    search_keyword = search_keyword_term(keyword)
                     
                     # 多字段模糊搜索
                     conditions.append("""(
@@ -553,7 +719,7 @@ class MaterialDatabase:
                     params.extend([like_pattern, like_pattern, like_pattern, like_pattern])
                 
                 # 添加材质类型和路径条件（需要关联samplers表）
-                if material_type or material_path:
+                if join_samplers:
                     base_query += " LEFT JOIN material_samplers s ON m.id = s.material_id"
                     
                     if material_type:
@@ -580,7 +746,7 @@ class MaterialDatabase:
     def search_materials_extended(self, library_id: int = None, keyword: str = "") -> List[Dict[str, Any]]:
         """扩展搜索材质（支持材质名称、着色器名称、样例名称）"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
@@ -630,9 +796,9 @@ class MaterialDatabase:
     def advanced_search_materials(self, search_criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
         """高级搜索材质（支持多条件和匹配模式）"""
         try:
-            logger.debug(f"[数据库调试] 接收到的搜索条件: {search_criteria}")
+            logger.debug("[数据库调试] 接收到的搜索条件: %s", search_criteria)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 # 确保每次都重新设置row_factory
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
@@ -666,9 +832,9 @@ class MaterialDatabase:
                 
                 # 处理从界面传来的搜索条件
                 for condition in search_criteria.get('conditions', []):
-                    logger.debug(f"处理搜索条件: {condition}")
+                    logger.debug("处理搜索条件: %s", condition)
                     condition_sql = self._build_single_condition(condition, fuzzy_search)
-                    logger.debug(f"生成的SQL条件: {condition_sql}")
+                    logger.debug("生成的SQL条件: %s", condition_sql)
                     if condition_sql:
                         condition_type = condition.get('type', 'unknown')
                         if condition_type not in conditions_by_type:
@@ -681,7 +847,7 @@ class MaterialDatabase:
                     else:
                         logger.warning(f"条件被跳过（无有效SQL）: {condition}")
                 
-                logger.debug(f"按类型分组的条件: {conditions_by_type}")
+                logger.debug("按类型分组的条件: %s", conditions_by_type)
                 
                 # 构建最终的搜索条件
                 search_conditions = []
@@ -726,18 +892,18 @@ class MaterialDatabase:
                 
                 base_query += " ORDER BY m.filename"
                 
-                logger.debug(f"最终SQL查询: {base_query}")
-                logger.debug(f"查询参数: {params}")
+                logger.debug("最终SQL查询: %s", base_query)
+                logger.debug("查询参数: %s", params)
                 
                 cursor.execute(base_query, params)
                 results = [dict(row) for row in cursor.fetchall()]
                 
-                logger.debug(f"SQL查询返回结果数: {len(results)}")
+                logger.debug("SQL查询返回结果数: %d", len(results))
                 
                 # 对需要后处理的搜索进行精确过滤
                 if search_criteria.get('conditions'):
                     results = self._post_process_advanced_search(results, search_criteria['conditions'], match_mode)
-                    logger.debug(f"后处理后结果数: {len(results)}")
+                    logger.debug("后处理后结果数: %d", len(results))
                 
                 return results
                 
@@ -1021,7 +1187,7 @@ class MaterialDatabase:
         if not param_values:
             return {}
         
-        logger.debug(f"解析的参数值: {param_values}")
+        logger.debug("解析的参数值: %s", param_values)
         
         # 无论单个值还是多个值，都只进行基本的预筛选
         # 精确匹配将在后处理中完成
@@ -1091,7 +1257,7 @@ class MaterialDatabase:
     def get_material_detail(self, material_id: int) -> Optional[Dict[str, Any]]:
         """获取材质详细信息"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
@@ -1157,7 +1323,7 @@ class MaterialDatabase:
     def check_material_exists(self, library_id: int, filename: str) -> bool:
         """检查材质是否存在"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 # 检查 filename (逻辑名) 或 file_name (实际xml文件名)
                 cursor.execute("SELECT 1 FROM materials WHERE library_id=? AND (filename=? OR file_name=?) LIMIT 1", (library_id, filename, filename))
@@ -1169,7 +1335,7 @@ class MaterialDatabase:
     def update_material(self, material_id: int, material_data: Dict[str, Any]):
         """更新材质信息"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # 更新基本信息
@@ -1235,7 +1401,7 @@ class MaterialDatabase:
     def get_statistics(self) -> Dict[str, Any]:
         """获取数据库统计信息"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # 库数量
@@ -1301,9 +1467,8 @@ class MaterialDatabase:
             # 没有需要后处理的条件，直接返回SQL结果
             return results
         
-        logger.debug(f"需要后处理的参数条件: {len(param_conditions_need_check)}，"
-                    f"不需要后处理的: {len(param_conditions_no_check)}，"
-                    f"匹配模式: {match_mode}")
+        logger.debug("需要后处理的参数条件: %d，不需要后处理的: %d，匹配模式: %s",
+                     len(param_conditions_need_check), len(param_conditions_no_check), match_mode)
         
         # 如果是OR模式且有不需要后处理的条件，说明SQL查询已经包含了这些条件
         # 我们只需要对需要后处理的条件进行额外检查
@@ -1324,7 +1489,7 @@ class MaterialDatabase:
         filtered_results = []
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 # 确保独立的连接设置
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
@@ -1395,7 +1560,7 @@ class MaterialDatabase:
                     if should_include:
                         filtered_results.append(result)
                         
-                logger.debug(f"后处理前结果数: {len(results)}, 后处理后结果数: {len(filtered_results)}")
+                logger.debug("后处理前结果数: %d, 后处理后结果数: %d", len(results), len(filtered_results))
         
         except sqlite3.Error as e:
             logger.error(f"参数后处理失败: {str(e)}")
@@ -1421,7 +1586,7 @@ class MaterialDatabase:
         )
         count = cursor.fetchone()[0]
         
-        logger.debug(f"材质 {material_id} 包含 '{content}' 参数: {count > 0} (找到 {count} 个)")
+        logger.debug("材质 %s 包含 '%s' 参数: %s (找到 %d 个)", material_id, content, count > 0, count)
         return count > 0
     
     def _check_material_parameter_range(self, cursor, material_id: int, 
@@ -1433,6 +1598,14 @@ class MaterialDatabase:
         content = condition.get('content', '').strip()
         range_data = condition.get('range', {})
         
+        # 范围上下限只转换一次；给出了但无法解析的边界视为不匹配
+        raw_min = range_data.get('min')
+        raw_max = range_data.get('max')
+        min_val = _try_float(raw_min)
+        max_val = _try_float(raw_max)
+        if (raw_min is not None and min_val is None) or (raw_max is not None and max_val is None):
+            return False
+        
         # 获取材质的参数
         cursor.execute("SELECT name, value FROM material_params WHERE material_id = ?", (material_id,))
         params = cursor.fetchall()
@@ -1453,24 +1626,19 @@ class MaterialDatabase:
                     continue
                 
                 # 检查数组中是否有值在指定范围内
-                min_val = range_data.get('min')
-                max_val = range_data.get('max')
-                
                 for value in array_values:
-                    try:
-                        numeric_value = float(value)
-                        
-                        # 检查范围
-                        if min_val is not None and numeric_value < float(min_val):
-                            continue
-                        if max_val is not None and numeric_value > float(max_val):
-                            continue
-                        
-                        # 如果有值在范围内，则匹配成功
-                        return True
-                        
-                    except (ValueError, TypeError):
+                    numeric_value = _try_float(value)
+                    if numeric_value is None:
                         continue
+                    
+                    # 检查范围
+                    if min_val is not None and numeric_value < min_val:
+                        continue
+                    if max_val is not None and numeric_value > max_val:
+                        continue
+                    
+                    # 如果有值在范围内，则匹配成功
+                    return True
                         
             except (json.JSONDecodeError, ValueError):
                 # 如果JSON解析失败，尝试简单的数值提取
@@ -1478,20 +1646,17 @@ class MaterialDatabase:
                     # 使用正则表达式提取数值
                     numbers = re.findall(r'-?\d+\.?\d*', param_value)
                     for num_str in numbers:
-                        try:
-                            numeric_value = float(num_str)
-                            
-                            # 检查范围
-                            if min_val is not None and numeric_value < float(min_val):
-                                continue
-                            if max_val is not None and numeric_value > float(max_val):
-                                continue
-                            
-                            # 如果有值在范围内，则匹配成功
-                            return True
-                            
-                        except (ValueError, TypeError):
+                        # 正则提取的都是合法数值，无需异常处理
+                        numeric_value = float(num_str)
+                        
+                        # 检查范围
+                        if min_val is not None and numeric_value < min_val:
+                            continue
+                        if max_val is not None and numeric_value > max_val:
                             continue
+                        
+                        # 如果有值在范围内，则匹配成功
+                        return True
                             
                 except Exception:
                     continue
@@ -1515,7 +1680,7 @@ class MaterialDatabase:
         # 统计目标值的出现次数（支持重复值）
         target_counter = Counter(target_values)
         
-        logger.debug(f"检查材质 {material_id} 的数组匹配: {target_values}, 计数: {dict(target_counter)}")
+        logger.debug("检查材质 %s 的数组匹配: %s, 计数: %s", material_id, target_values, target_counter)
         
         # 获取材质的参数
         cursor.execute("SELECT name, value FROM material_params WHERE material_id = ?", (material_id,))
@@ -1536,7 +1701,7 @@ class MaterialDatabase:
                 if not isinstance(array_values, list):
                     continue
                 
-                logger.debug(f"检查参数 {param_name}: {array_values}")
+                logger.debug("检查参数 %s: %s", param_name, array_values)
                 
                 if len(target_values) == 1:
                     # 单个值搜索：检查数组中是否包含该值
@@ -1549,7 +1714,7 @@ class MaterialDatabase:
                             try:
                                 array_numeric = float(array_value)
                                 if abs(target_numeric - array_numeric) < 1e-6:  # 浮点数精度容错
-                                    logger.debug(f"单值匹配成功: {target_value} 在 {array_values}")
+                                    logger.debug("单值匹配成功: %s 在 %s", target_value, array_values)
                                     return True
                             except (ValueError, TypeError):
                                 continue
@@ -1558,7 +1723,7 @@ class MaterialDatabase:
                         target_str = str(target_value)
                         for array_value in array_values:
                             if str(array_value) == target_str:
-                                logger.debug(f"单值字符串匹配成功: {target_value} 在 {array_values}")
+                                logger.debug("单值字符串匹配成功: %s 在 %s", target_value, array_values)
                                 return True
                 
                 else:
@@ -1593,8 +1758,8 @@ class MaterialDatabase:
                         except (ValueError, TypeError):
                             normalized_target_counter[str(target_value)] += 1
                     
-                    logger.debug(f"数组计数: {dict(array_counter)}")
-                    logger.debug(f"目标计数: {dict(normalized_target_counter)}")
+                    logger.debug("数组计数: %s", array_counter)
+                    logger.debug("目标计数: %s", normalized_target_counter)
                     
                     # 检查数组是否包含足够数量的每个目标值
                     match = True
@@ -1604,11 +1769,11 @@ class MaterialDatabase:
                             break
                     
                     if match:
-                        logger.debug(f"多值匹配成功: {target_values} 在 {array_values}")
+                        logger.debug("多值匹配成功: %s 在 %s", target_values, array_values)
                         return True
                     
             except (json.JSONDecodeError, ValueError) as e:
-                logger.debug(f"JSON解析失败: {e}, 尝试字符串匹配")
+                logger.debug("JSON解析失败: %s, 尝试字符串匹配", e)
                 # 如果JSON解析失败，尝试简单的字符串匹配
                 try:
                     if len(target_values) == 1:
@@ -1660,13 +1825,13 @@ class MaterialDatabase:
             # 没有需要后处理的条件，直接返回SQL结果
             return results
         
-        logger.debug(f"需要后处理的条件数: {len(conditions_need_check)}，匹配模式: {match_mode}")
+        logger.debug("需要后处理的条件数: %d，匹配模式: %s", len(conditions_need_check), match_mode)
         
         # 获取所有材质的详细信息进行精确过滤
         filtered_results = []
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
@@ -1709,7 +1874,7 @@ class MaterialDatabase:
             logger.error(f"后处理时数据库错误: {e}")
             return results  # 如果后处理失败，返回原结果
         
-        logger.debug(f"后处理前结果数: {len(results)}, 后处理后结果数: {len(filtered_results)}")
+        logger.debug("后处理前结果数: %d, 后处理后结果数: %d", len(results), len(filtered_results))
         return filtered_results
     
     def _check_material_parameter_condition(self, cursor, material_id: int, condition: Dict[str, Any]) -> bool:
@@ -1805,7 +1970,7 @@ class MaterialDatabase:
     def search_materials_by_name(self, material_name: str, library_id: int = None) -> List[Dict[str, Any]]:
         """根据材质名称搜索材质"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 if library_id:
@@ -1845,7 +2010,7 @@ class MaterialDatabase:
     def get_material_by_id(self, material_id: int) -> Optional[Dict[str, Any]]:
         """根据ID获取单个材质"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 query = '''
@@ -1873,7 +2038,7 @@ class MaterialDatabase:
     def get_materials_by_library(self, library_id: int) -> List[Dict[str, Any]]:
         """获取指定库中的所有材质"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 query = '''
@@ -1907,7 +2072,7 @@ class MaterialDatabase:
     def get_samplers(self, material_id: int) -> List[Dict[str, Any]]:
         """获取材质的采样器信息"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 query = '''
@@ -1932,7 +2097,7 @@ class MaterialDatabase:
     def get_parameters(self, material_id: int) -> List[Dict[str, Any]]:
         """获取材质的参数信息"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 query = '''
@@ -1973,13 +2138,13 @@ class MaterialDatabase:
         try:
             # 路径标准化并提取文件名
             normalized = path_pattern.replace('\\\\', '\\').replace('/', '\\')
-            filename = normalized.split('\\')[-1]
+            filename = normalized.rpartition('\\')[2]
             
             # 去掉.matxml后缀（如果有）
             if filename.lower().endswith('.matxml'):
                 filename = filename[:-7]
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # 构建查询：同时搜索材质MTD路径和采样器纹理路径
@@ -1,5 +1,7 @@
 import locale
-from typing import Dict
+import sys
+from functools import lru_cache
+from typing import Callable, Dict, List
 
 class LanguageManager:
     """多语言管理器"""
@@ -7,6 +9,10 @@ class LanguageManager:
     def __init__(self):
         self.current_language = self._detect_system_language()
         self.translations = self._load_translations()
+        # 当前语言的翻译表（切换语言时更新），查找时无需再按语言取表
+        self._table = self._resolve_table()
+        # 语言切换回调（例如清理翻译缓存）
+        self._language_callbacks: List[Callable[[], None]] = []
     
     def _detect_system_language(self) -> str:
         """检测系统语言"""
@@ -794,6 +800,7 @@ class LanguageManager:
             'import_dcx_success_msg': '导入成功：库ID={lib_id}，材质数量={count}',
             'import_dcx_failed_msg': '导入失败：{error}',
             'please_input_library_name': '请输入库名称',
+            'description_too_long': '描述过长（{length} 字符），请精简到 {max} 字符以内',
             
             # DCX导入进度阶段
             'import_progress': '导入进度',
@@ -1456,6 +1463,7 @@ class LanguageManager:
             'import_dcx_success_msg': 'Import Success: ID={lib_id}, Count={count}',
             'import_dcx_failed_msg': 'Import Failed: {error}',
             'please_input_library_name': 'Please input library name',
+            'description_too_long': 'Description is too long ({length} characters); please shorten it to {max} characters or fewer',
             'select_type': 'Select Type',
             'select_import_source_type': 'Please select import source type:',
             'select_dcx_file': 'Select DCX File',
@@ -2317,6 +2325,7 @@ class LanguageManager:
             'add_to_autopack_failed': '自動パックリストへの追加に失敗しました: {error}',
             'autopack_complete_status': '自動パック完了: 成功 {success}、失敗 {failed}',
             'import_dcx_failed': 'DCXマテリアルライブラリのインポートに失敗しました: {error}',
+            'description_too_long': '説明が長すぎます（{length} 文字）。{max} 文字以内に短くしてください',
             'select_type': 'タイプ選択',
             'select_import_source_type': 'インポートソースのタイプを選択してください：',
             'select_dcx_file': 'DCXファイルを選択',
@@ -2947,6 +2956,7 @@ class LanguageManager:
             'add_to_autopack_failed': '자동 팩 목록에 추가 실패: {error}',
             'autopack_complete_status': '자동 팩 완료: 성공 {success}개, 실패 {failed}개',
             'import_dcx_failed': 'DCX 재질 라이브러리 가져오기 실패: {error}',
+            'description_too_long': '설명이 너무 깁니다({length}자). {max}자 이내로 줄여 주세요',
             'select_type': '유형 선택',
             'select_import_source_type': '가져올 소스 유형을 선택하세요:',
             'select_dcx_file': 'DCX 파일 선택',
@@ -3546,19 +3556,23 @@ class LanguageManager:
     
     def get_text(self, key: str) -> str:
         """获取指定键的翻译文本"""
-        try:
-            if self.current_language in self.translations:
-                return self.translations[self.current_language].get(key, key)
-            else:
-                # 如果当前语言不存在，使用英文作为后备
-                return self.translations['en_US'].get(key, key)
-        except Exception:
-            return key
+        return self._table.get(key, key)
+
+    def _resolve_table(self) -> Dict[str, str]:
+        # 如果当前语言不存在，使用英文作为后备
+        return self.translations.get(self.current_language) or self.translations['en_US']
     
     def set_language(self, language: str):
-        """设置当前语言"""
-        if language in self.translations:
+        """设置当前语言（语言未变化时不触发回调，翻译缓存保持有效）"""
+        if language in self.translations and language != self.current_language:
             self.current_language = language
+            self._table = self._resolve_table()
+            for callback in self._language_callbacks:
+                callback()
+
+    def add_language_callback(self, callback: Callable[[], None]):
+        """注册语言切换回调"""
+        self._language_callbacks.append(callback)
     
     def get_current_language(self) -> str:
         """获取当前语言"""
@@ -3576,9 +3590,29 @@ class LanguageManager:
 # 创建全局语言管理器实例
 language_manager = LanguageManager()
 
-def _(key: str) -> str:
-    """快捷翻译函数"""
-    return language_manager.get_text(key)
+@lru_cache(maxsize=1024)
+def _raw(key: str) -> str:
+    """带缓存的翻译查找（语言切换时清空）；结果驻留，各界面组件共享同一字符串对象"""
+    return sys.intern(language_manager.get_text(key))
+
+@lru_cache(maxsize=256)
+def _template_format(key: str) -> Callable[..., str]:
+    """带参数翻译模板的 format 方法（按键缓存，语言切换时清空）"""
+    return _raw(key).format
+
+def invalidate():
+    """清空翻译缓存（切换语言或修改翻译表后调用）"""
+    _raw.cache_clear()
+    _template_format.cache_clear()
+
+language_manager.add_language_callback(invalidate)
+
+# 快捷翻译函数：无参数的常见情况直接命中缓存，不再多一层 Python 调用
+_ = _raw
+
+def _fmt(key: str, *args, **kwargs) -> str:
+    """带参数的翻译：直接调用缓存的模板 format 方法"""
+    return _template_format(key)(*args, **kwargs)
 
 def get_language_manager():
     """兼容旧接口：返回全局 language_manager 实例"""
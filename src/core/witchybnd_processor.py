@@ -13,14 +13,50 @@ import shutil
 import logging
 import threading
 import time
-from typing import List, Dict, Optional, Tuple, Callable
+from typing import List, Dict, Tuple, Callable
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 
 from src.utils.resource_path import get_tools_path, get_data_path, get_base_path, get_exe_dir
 
 logger = logging.getLogger(__name__)
 
+
+def _iter_files(root: str, suffixes: Tuple[str, ...]):
+    """
+    基于 os.scandir 的迭代式目录遍历，产出指定后缀的文件路径
+    
+    DirEntry 缓存了读取目录时得到的类型信息，is_dir/is_file 无需再次 stat，
+    在网络共享目录上比 os.walk 快得多。后缀比较不区分大小写，
+    只对文件名末尾对应长度的部分转小写，不复制整个文件名。
+    """
+    suffix_set = {s.lower() for s in suffixes}
+    suffix_lengths = sorted({len(s) for s in suffix_set})
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        name = entry.name
+                        if any(name[-n:].lower() in suffix_set for n in suffix_lengths
+                               if len(name) >= n) and entry.is_file():
+                            yield entry.path
+        except OSError as e:
+            logger.warning(f"无法读取目录 {current}: {e}")
+
+
+def _iter_xml_files(root: str):
+    """遍历目录下的材质XML文件（跳过 WitchyBND 自身生成的 _witchy 文件）"""
+    for path in _iter_files(root, ('.xml',)):
+        if not os.path.basename(path).startswith('_witchy'):
+            yield path
+
+
 class WitchyBNDProcessor:
     """WitchyBND工具处理器 - 模拟拖放版本"""
     
@@ -240,11 +276,7 @@ class WitchyBNDProcessor:
             
             if output_dir:
                 # 统计生成的 XML 文件数量
-                xml_count = 0
-                for root, dirs, files in os.walk(output_dir):
-                    for f in files:
-                        if f.endswith('.xml'):
-                            xml_count += 1
+                xml_count = sum(1 for _ in _iter_files(output_dir, ('.xml',)))
                 
                 logger.info(f"递归解包完成: 输出目录 {output_dir}, 生成 {xml_count} 个 XML 文件")
                 return True, "", output_dir
@@ -567,9 +599,9 @@ class WitchyBNDProcessor:
                             logger.error(f"调试信息 - 新出现的项目: {list(new_items)}")
                             
                             # 列出所有可能相关的目录
-                            dcx_basename = os.path.splitext(os.path.basename(dcx_file))[0]
+                            dcx_stem = os.path.basename(dcx_file).split('.')[0].lower()
                             related_items = [item for item in current_items 
-                                           if dcx_basename.split('.')[0].lower() in item.lower()]
+                                           if dcx_stem in item.lower()]
                             logger.error(f"调试信息 - 相关项目: {related_items}")
                         except Exception as debug_e:
                             logger.error(f"调试信息收集失败: {debug_e}")
@@ -1117,25 +1149,35 @@ class MaterialLibraryImporter:
         # 获取CPU核心数，用于并行处理
         self._max_workers = min(os.cpu_count() or 4, 16)  # 最多使用16个线程
     
-    def _parse_single_xml(self, xml_file: str, parser) -> Tuple[Optional[Dict], str, Optional[str]]:
+    # XML 文件数达到该值时使用多进程解析（进程启动有固定开销，小批量用线程更快）
+    PROCESS_POOL_MIN_FILES = 1000
+    
+    def _iter_parsed_xml(self, xml_files: List[str]):
         """
-        解析单个XML文件（用于并行处理）
+        并行解析XML文件，逐个产出 (材质数据, 文件路径, 错误信息)
         
-        Args:
-            xml_file: XML文件路径
-            parser: MaterialXMLParser实例
-            
-        Returns:
-            (材质数据, 文件路径, 错误信息) 元组
+        XML 解析是 CPU 密集型任务，文件较多时使用进程池绕开 GIL；
+        进程池不可用时（如受限环境）回退到线程池处理剩余文件。
         """
-        try:
-            material_data = parser.parse_file(xml_file)
-            if material_data:
-                return (material_data, xml_file, None)
-            else:
-                return (None, xml_file, "解析返回空结果")
-        except Exception as e:
-            return (None, xml_file, str(e))
+        from .xml_parser import parse_material_file
+        
+        pending = xml_files
+        if len(xml_files) >= self.PROCESS_POOL_MIN_FILES:
+            done = 0
+            try:
+                with ProcessPoolExecutor(max_workers=os.cpu_count() or 4) as pool:
+                    for parsed in pool.map(parse_material_file, xml_files, chunksize=16):
+                        done += 1
+                        yield parsed
+                return
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"多进程解析不可用，改用线程池: {e}")
+                pending = xml_files[done:]
+        
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = [executor.submit(parse_material_file, xml_file) for xml_file in pending]
+            for future in as_completed(futures):
+                yield future.result()
     
     def import_from_dcx(self, dcx_file: str, library_name: str, description: str = "",
                        progress_callback: Callable[[str, int, int], None] = None) -> Dict[str, any]:
@@ -1180,11 +1222,7 @@ class MaterialLibraryImporter:
                 extracted_dir = dcx_file
                 
                 # 收集 matbin 文件
-                matbin_files = []
-                for root, dirs, files in os.walk(extracted_dir):
-                    for f in files:
-                        if f.endswith('.matbin') or f.endswith('.mtd'):
-                            matbin_files.append(os.path.join(root, f))
+                matbin_files = list(_iter_files(extracted_dir, ('.matbin', '.mtd')))
                 
                 if matbin_files:
                     logger.info(f"找到 {len(matbin_files)} 个材质文件，开始批量转换")
@@ -1198,6 +1236,8 @@ class MaterialLibraryImporter:
                     )
             else:
                 # DCX 文件：使用 -c -p 一步完成解包和转换
+                # 注意：DCX 本体由 WitchyBND 子进程直接读取，Python 侧不加载文件内容，
+                # 内存占用只与解包后的 XML 解析有关
                 report_progress("解包DCX并转换材质", 0, 0)
                 logger.info(f"开始递归解包DCX文件（使用 -c -p 模式）: {dcx_file}")
                 
@@ -1215,10 +1255,7 @@ class MaterialLibraryImporter:
             report_progress("收集XML文件", 0, 0)
             xml_files = []
             if extracted_dir and os.path.isdir(extracted_dir):
-                for root, dirs, files in os.walk(extracted_dir):
-                    for f in files:
-                        if f.endswith('.xml') and not f.startswith('_witchy'):
-                            xml_files.append(os.path.join(root, f))
+                xml_files = list(_iter_xml_files(extracted_dir))
             
             result['xml_files'] = xml_files
             logger.info(f"找到 {len(xml_files)} 个XML文件")
@@ -1235,82 +1272,46 @@ class MaterialLibraryImporter:
             )
             result['library_id'] = library_id
             
-            # 4. 并行解析XML文件（性能优化关键）
-            from .xml_parser import MaterialXMLParser
-            from concurrent.futures import ThreadPoolExecutor, as_completed
-            
-            parser = MaterialXMLParser()
-            materials_data = []
+            # 4+5. 并行解析XML文件并流式写入数据库
+            # 每个XML只含一个材质，解析结果直接交给 add_materials 写入，
+            # 不再先把全部材质数据收集到列表中，峰值内存只与并行度有关
             successfully_parsed_xml_files = []
             total_files = len(xml_files)
-            parsed_count = 0
-            
-            logger.info(f"开始并行解析 {total_files} 个XML文件（使用 {self._max_workers} 个线程）...")
-            report_progress("解析XML文件", 0, total_files)
             
-            # 使用线程池并行解析XML
-            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
-                # 提交所有解析任务
-                future_to_file = {
-                    executor.submit(self._parse_single_xml, xml_file, parser): xml_file 
-                    for xml_file in xml_files
-                }
-                
-                # 收集结果
-                for future in as_completed(future_to_file):
+            def iter_materials():
+                parsed_count = 0
+                for material_data, xml_file, error in self._iter_parsed_xml(xml_files):
                     parsed_count += 1
-                    xml_file = future_to_file[future]
                     report_progress("解析XML文件", parsed_count, total_files)
                     
-                    try:
-                        material_data, xml_file, error = future.result()
-                        if material_data:
-                            materials_data.append(material_data)
-                            successfully_parsed_xml_files.append(xml_file)
-                            logger.debug(f"解析成功: {material_data.get('filename', 'unknown')}")
-                        else:
-                            logger.warning(f"跳过XML文件 {os.path.basename(xml_file)}: {error}")
-                            logger.info(f"保留XML文件以便手动检查: {xml_file}")
-                    except Exception as e:
-                        xml_file = future_to_file[future]
-                        logger.warning(f"跳过XML文件 {os.path.basename(xml_file)}: {str(e)}")
+                    if material_data:
+                        successfully_parsed_xml_files.append(xml_file)
+                        logger.debug(f"解析成功: {material_data.get('filename', 'unknown')}")
+                        yield material_data
+                    else:
+                        logger.warning(f"跳过XML文件 {os.path.basename(xml_file)}: {error}")
                         logger.info(f"保留XML文件以便手动检查: {xml_file}")
             
-            logger.info(f"XML解析完成：成功 {len(materials_data)}/{total_files}")
+            logger.info(f"开始并行解析并导入 {total_files} 个XML文件...")
+            report_progress("解析XML文件", 0, total_files)
             
-            # 5. 批量添加到数据库（使用优化后的add_materials方法）
-            if materials_data:
-                total_materials = len(materials_data)
-                logger.info(f"开始添加 {total_materials} 个材质到数据库...")
-                report_progress("写入数据库", 0, total_materials)
-                
-                try:
-                    # 定义数据库进度回调
-                    def db_progress(current, total, message=""):
-                        report_progress("写入数据库", current, total)
-                    
-                    # 使用优化后的批量添加方法
-                    if hasattr(self.database, 'add_materials'):
-                        self.database.add_materials(
-                            library_id, 
-                            materials_data,
-                            progress_callback=db_progress
-                        )
-                    else:
-                        # 如果没有批量添加方法，逐个添加
-                        for i, material_data in enumerate(materials_data):
-                            self.database.add_material(library_id, material_data)
-                            report_progress("写入数据库", i + 1, total_materials)
-                    
-                    result['material_count'] = total_materials
-                    logger.info(f"成功添加 {total_materials} 个材质到数据库")
-                except Exception as e:
-                    logger.error(f"添加材质到数据库失败: {str(e)}")
-                    result['material_count'] = total_materials
-                    result['database_error'] = str(e)
-            else:
-                logger.warning("没有成功解析的材质数据")
-                result['material_count'] = 0
+            try:
+                material_count = self.database.add_materials(
+                    library_id,
+                    iter_materials(),
+                    total=total_files
+                )
+                result['material_count'] = material_count
+                if material_count:
+                    logger.info(f"成功添加 {material_count} 个材质到数据库")
+                else:
+                    logger.warning("没有成功解析的材质数据")
+            except Exception as e:
+                logger.error(f"添加材质到数据库失败: {str(e)}")
+                result['material_count'] = len(successfully_parsed_xml_files)
+                result['database_error'] = str(e)
+            
+            logger.info(f"XML解析完成：成功 {len(successfully_parsed_xml_files)}/{total_files}")
             
             # 6. 清理XML文件，只删除成功解析的文件
             # 6. 清理XML文件，只删除成功解析的文件
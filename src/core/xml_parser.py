@@ -515,6 +515,32 @@ class MaterialXMLParser:
                 elem.tail = f"\n{indent * level}"
 
 
+# 每个进程复用的解析器实例（供 parse_material_file 使用）
+_shared_parser: Optional[MaterialXMLParser] = None
+
+
+def parse_material_file(xml_file: str) -> Tuple[Optional[Dict[str, Any]], str, Optional[str]]:
+    """
+    解析单个材质XML文件（模块级函数，可被 ProcessPoolExecutor 序列化调用）
+    
+    Args:
+        xml_file: XML文件路径
+        
+    Returns:
+        (材质数据, 文件路径, 错误信息) 元组
+    """
+    global _shared_parser
+    if _shared_parser is None:
+        _shared_parser = MaterialXMLParser()
+    try:
+        material_data = _shared_parser.parse_file(xml_file)
+        if material_data:
+            return (material_data, xml_file, None)
+        return (None, xml_file, "解析返回空结果")
+    except Exception as e:
+        return (None, xml_file, str(e))
+
+
 class XMLParser:
     """MATBIN材质XML文件解析器"""
     
@@ -650,9 +676,10 @@ class XMLParser:
             
         except Exception as e:
             logger.error(f"提取材质信息失败: {xml_file} - {str(e)}")
+            filename = os.path.basename(xml_file)
             return {
-                'filename': os.path.basename(xml_file),
-                'material_name': os.path.splitext(os.path.basename(xml_file))[0],
+                'filename': filename,
+                'material_name': os.path.splitext(filename)[0],
                 'error': str(e)
             }
     
@@ -8,16 +8,17 @@ Advanced Search Dialog for Qt
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QComboBox, QLineEdit, QCheckBox, QRadioButton, QButtonGroup,
-    QScrollArea, QWidget, QFrame, QSpinBox, QDoubleSpinBox, QGroupBox
+    QScrollArea, QWidget, QFrame, QGroupBox
 )
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QIcon
-from typing import Dict, List, Any, Optional
+from typing import Dict, Any, Optional
 import os
 
 from src.core.i18n import _
 from src.utils.resource_path import get_assets_path
 from src.gui_qt.standard_dialogs import apply_button_style
+from src.gui_qt.widgets.focus_wheel import FocusWheelComboBox, FocusWheelDoubleSpinBox
 
 
 
@@ -26,9 +27,14 @@ class SearchConditionWidget(QFrame):
     
     deleted = Signal(object)  # 删除信号
     
+    # 搜索类型键（与类型下拉框的选项顺序一致）
+    TYPE_KEYS = ('material_name', 'shader', 'sampler', 'parameter')
+    
     def __init__(self, index: int, parent=None):
         super().__init__(parent)
         self.index = index
+        # 当前搜索类型键（选择时按下拉框序号确定，无需与译文比较）
+        self.search_type = self.TYPE_KEYS[0]
         self._setup_ui()
         self._connect_signals()
     
@@ -87,7 +93,7 @@ class SearchConditionWidget(QFrame):
         type_label_container = self._create_label_with_decoration(_('search_type'))
         first_row.addWidget(type_label_container)
         
-        self.type_combo = QComboBox()
+        self.type_combo = FocusWheelComboBox()
         self.type_combo.addItems([
             _('material_name'),
             _('shader_search'),
@@ -153,7 +159,13 @@ class SearchConditionWidget(QFrame):
         
         layout.addLayout(first_row)
         
-        # 第二行：采样器高级选项
+        # 第二、三行：采样器/参数高级选项（选中对应搜索类型时才创建）
+        self._main_layout = layout
+        self.sampler_frame: Optional[QWidget] = None
+        self.param_frame: Optional[QWidget] = None
+    
+    def _build_sampler_frame(self):
+        """创建采样器高级选项（首次选择采样器搜索时调用）"""
         self.sampler_frame = QWidget()
         self.sampler_frame.setStyleSheet("QWidget { background: transparent; }")
         sampler_layout = QVBoxLayout(self.sampler_frame)
@@ -191,9 +203,11 @@ class SearchConditionWidget(QFrame):
         
         sampler_layout.addLayout(sampler_details)
         self.sampler_frame.setVisible(False)
-        layout.addWidget(self.sampler_frame)
-        
-        # 第三行：参数高级选项
+        self._main_layout.addWidget(self.sampler_frame)
+        self.sampler_specific_check.toggled.connect(self._on_sampler_mode_changed)
+    
+    def _build_param_frame(self):
+        """创建参数高级选项（首次选择参数搜索时调用）"""
         self.param_frame = QWidget()
         self.param_frame.setStyleSheet("QWidget { background: transparent; }")
         param_layout = QVBoxLayout(self.param_frame)
@@ -226,7 +240,7 @@ class SearchConditionWidget(QFrame):
         min_label_container = self._create_label_with_decoration(_('min_value'))
         range_inputs.addWidget(min_label_container)
         
-        self.min_spin = QDoubleSpinBox()
+        self.min_spin = FocusWheelDoubleSpinBox()
         self.min_spin.setRange(-999999, 999999)
         self.min_spin.setDecimals(4)
         self.min_spin.setEnabled(False)
@@ -238,7 +252,7 @@ class SearchConditionWidget(QFrame):
         max_label_container = self._create_label_with_decoration(_('max_value'))
         range_inputs.addWidget(max_label_container)
         
-        self.max_spin = QDoubleSpinBox()
+        self.max_spin = FocusWheelDoubleSpinBox()
         self.max_spin.setRange(-999999, 999999)
         self.max_spin.setDecimals(4)
         self.max_spin.setEnabled(False)
@@ -246,7 +260,8 @@ class SearchConditionWidget(QFrame):
         
         param_layout.addLayout(range_inputs)
         self.param_frame.setVisible(False)
-        layout.addWidget(self.param_frame)
+        self._main_layout.addWidget(self.param_frame)
+        self.range_check.toggled.connect(self._on_range_check_changed)
     
     def _create_label_with_decoration(self, text: str) -> QWidget:
         """创建带左侧蓝色竖线装饰的标签
@@ -289,21 +304,23 @@ class SearchConditionWidget(QFrame):
     def _connect_signals(self):
         """连接信号"""
         self.delete_btn.clicked.connect(lambda: self.deleted.emit(self))
-        self.type_combo.currentTextChanged.connect(self._on_type_changed)
-        self.sampler_specific_check.toggled.connect(self._on_sampler_mode_changed)
-        self.range_check.toggled.connect(self._on_range_check_changed)
+        self.type_combo.currentIndexChanged.connect(self._on_type_changed)
     
-    def _on_type_changed(self, text: str):
+    def _on_type_changed(self, index: int):
         """搜索类型改变"""
-        # 隐藏所有高级选项
-        self.sampler_frame.setVisible(False)
-        self.param_frame.setVisible(False)
-        
-        # 根据类型显示相应选项
-        if text == _('sampler_search'):
-            self.sampler_frame.setVisible(True)
-        elif text == _('parameter_search'):
-            self.param_frame.setVisible(True)
+        search_type = self.TYPE_KEYS[index] if 0 <= index < len(self.TYPE_KEYS) else self.TYPE_KEYS[0]
+        self.search_type = search_type
+        # 首次选择采样器/参数搜索时才创建对应的高级选项
+        if search_type == 'sampler' and self.sampler_frame is None:
+            self._build_sampler_frame()
+        elif search_type == 'parameter' and self.param_frame is None:
+            self._build_param_frame()
+        
+        # 根据类型显示相应选项，其余高级选项隐藏
+        if self.sampler_frame is not None:
+            self.sampler_frame.setVisible(search_type == 'sampler')
+        if self.param_frame is not None:
+            self.param_frame.setVisible(search_type == 'parameter')
     
     def _on_sampler_mode_changed(self, checked: bool):
         """采样器模式切换"""
@@ -331,52 +348,50 @@ class SearchConditionWidget(QFrame):
     
     def get_condition_data(self) -> Optional[Dict[str, Any]]:
         """获取条件数据"""
-        search_type_text = self.type_combo.currentText()
+        search_type = self.search_type
         content = self.content_edit.text().strip()
         
+        # 当前类型的输入框各读取一次，后续判断和组装都使用局部变量
+        sampler_type = sampler_path = param_value = ''
+        if search_type == 'sampler':
+            sampler_type = self.sampler_type_edit.text().strip()
+            sampler_path = self.sampler_path_edit.text().strip()
+        elif search_type == 'parameter':
+            param_value = self.param_value_edit.text().strip()
+        
         # 基本条件检查
         has_basic_content = bool(content)
-        has_sampler_details = (search_type_text == _('sampler_search') and
-                              (self.sampler_type_edit.text().strip() or
-                               self.sampler_path_edit.text().strip()))
-        has_param_details = (search_type_text == _('parameter_search') and
-                           (self.param_value_edit.text().strip() or
-                            self.range_check.isChecked()))
+        has_sampler_details = bool(sampler_type or sampler_path)
+        has_param_details = (search_type == 'parameter' and
+                           (param_value or self.range_check.isChecked()))
         
         if not (has_basic_content or has_sampler_details or has_param_details):
             return None
         
-        # 转换搜索类型
-        type_map = {
-            _('material_name'): "material_name",
-            _('shader_search'): "shader",
-            _('sampler_search'): "sampler",
-            _('parameter_search'): "parameter"
-        }
-        
         condition_data = {
-            'type': type_map.get(search_type_text, 'material_name'),
+            'type': search_type,
             'content': content,
             'fuzzy': True
         }
         
         # 采样器搜索的额外数据
-        if search_type_text == _('sampler_search'):
+        if search_type == 'sampler':
             if self.sampler_specific_check.isChecked():
-                condition_data['sampler_type'] = self.sampler_type_edit.text().strip()
-                condition_data['sampler_path'] = self.sampler_path_edit.text().strip()
+                condition_data['sampler_type'] = sampler_type
+                condition_data['sampler_path'] = sampler_path
                 condition_data['specific_search'] = True
         
         # 参数搜索的额外数据
-        if search_type_text == _('parameter_search'):
-            param_value = self.param_value_edit.text().strip()
+        if search_type == 'parameter':
             if param_value:
                 condition_data['param_value'] = param_value
             
             if self.range_check.isChecked():
+                min_value = self.min_spin.value()
+                max_value = self.max_spin.value()
                 condition_data['range'] = {
-                    'min': self.min_spin.value() if self.min_spin.value() != 0 else None,
-                    'max': self.max_spin.value() if self.max_spin.value() != 0 else None
+                    'min': min_value if min_value != 0 else None,
+                    'max': max_value if max_value != 0 else None
                 }
         
         return condition_data
@@ -397,7 +412,8 @@ class AdvancedSearchDialogQt(QDialog):
         
         self.database = database
         self.on_search_callback = on_search_callback
-        self.condition_widgets: List[SearchConditionWidget] = []
+        # 条件组件按 id 索引（删除为 O(1)，dict 保持添加顺序）
+        self.condition_widgets: Dict[int, SearchConditionWidget] = {}
         
         self._setup_ui()
         self._add_condition()  # 添加第一个条件
@@ -549,13 +565,9 @@ class AdvancedSearchDialogQt(QDialog):
             }
         """)
         
-        self.conditions_container = QWidget()
-        self.conditions_layout = QVBoxLayout(self.conditions_container)
-        self.conditions_layout.setSpacing(10)
-        self.conditions_layout.addStretch()
-        
-        scroll_area.setWidget(self.conditions_container)
+        scroll_area.setWidget(self._create_conditions_container())
         layout.addWidget(scroll_area, 1)
+        self.scroll_area = scroll_area
         
         # 搜索模式区域 - 使用按钮样式（移除说明文字，按钮本身已包含说明）
         mode_group = QGroupBox(_('search_mode'))
@@ -628,6 +640,14 @@ class AdvancedSearchDialogQt(QDialog):
             self.and_btn.setChecked(False)
             self.or_btn.setChecked(True)
     
+    def _create_conditions_container(self) -> QWidget:
+        """创建条件列表容器（所有条件组件都放在此容器中）"""
+        self.conditions_container = QWidget()
+        self.conditions_layout = QVBoxLayout(self.conditions_container)
+        self.conditions_layout.setSpacing(10)
+        self.conditions_layout.addStretch()
+        return self.conditions_container
+    
     def _add_condition(self):
         """添加搜索条件"""
         # 在stretch之前插入
@@ -635,24 +655,25 @@ class AdvancedSearchDialogQt(QDialog):
         widget = SearchConditionWidget(index, self)
         widget.deleted.connect(self._remove_condition)
         
-        self.condition_widgets.append(widget)
+        self.condition_widgets[id(widget)] = widget
         self.conditions_layout.insertWidget(index, widget)
         
         self._update_status(_('search_added').format(index + 1))
     
     def _remove_condition(self, widget: SearchConditionWidget):
         """移除搜索条件"""
-        if widget in self.condition_widgets:
-            self.condition_widgets.remove(widget)
+        if self.condition_widgets.pop(id(widget), None) is not None:
             widget.deleteLater()
             
-            # 更新索引
-            for i, w in enumerate(self.condition_widgets):
-                w.index = i
+            # 更新索引（只有被删除条件之后的条件需要重新编号）
+            for w in self.condition_widgets.values():
+                if w.index < widget.index:
+                    continue
+                w.index -= 1
                 # 更新标题
                 title_label = w.findChild(QLabel)
                 if title_label:
-                    title_label.setText(_('advanced_search_condition_title').format(i + 1))
+                    title_label.setText(_('advanced_search_condition_title').format(w.index + 1))
             
             self._update_status(_('search_deleted').format(len(self.condition_widgets)))
             
@@ -662,9 +683,9 @@ class AdvancedSearchDialogQt(QDialog):
     
     def _clear_all(self):
         """清空所有条件"""
-        for widget in self.condition_widgets[:]:
-            widget.deleteLater()
         self.condition_widgets.clear()
+        # 整体替换条件容器：旧容器连同其中全部条件在 setWidget 时一次性销毁
+        self.scroll_area.setWidget(self._create_conditions_container())
         self._add_condition()
         self._update_status(_('search_cleared'))
     
@@ -672,7 +693,7 @@ class AdvancedSearchDialogQt(QDialog):
         """执行搜索"""
         # 收集搜索条件
         conditions = []
-        for widget in self.condition_widgets:
+        for widget in self.condition_widgets.values():
             condition_data = widget.get_condition_data()
             if condition_data:
                 conditions.append(condition_data)
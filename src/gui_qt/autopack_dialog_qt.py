@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import queue
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 
-from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QThread, Signal
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -14,14 +15,15 @@ from PySide6.QtWidgets import (
     QHeaderView,
     QFileDialog,
     QLineEdit,
-    QMessageBox,
     QAbstractItemView,
     QWidget,
     QGroupBox,
 )
 
 from src.core.autopack_manager import AutoPackManager
-from src.core.i18n import _
+from src.core.i18n import _, _fmt
+from src.gui_qt.standard_dialogs import MessageDialogPool
+from src.gui_qt.models import diff_row_range
 
 
 @dataclass
@@ -40,8 +42,12 @@ class _AutoPackTableModel(QAbstractTableModel):
 
     def __init__(self, items: Optional[List[Dict[str, Any]]] = None):
         super().__init__()
-        self._items: List[Dict[str, Any]] = items or []
+        self._items: List[Dict[str, Any]] = []
         self._checked: List[bool] = []  # 选中状态
+        self._ids: List[Optional[int]] = []  # 行号 -> 项目ID，加载时一次性建立
+        self._rows: List[tuple] = []  # 每行的显示文本，加载时一次性构建
+        if items:
+            self.load(items)
     
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         return len(self._items)
@@ -67,7 +73,6 @@ class _AutoPackTableModel(QAbstractTableModel):
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
         if not index.isValid():
             return None
-        item = self._items[index.row()]
         col = index.column()
 
         if role == Qt.CheckStateRole:
@@ -75,24 +80,7 @@ class _AutoPackTableModel(QAbstractTableModel):
                 return Qt.Checked if self._checked[index.row()] else Qt.Unchecked
         
         if role == Qt.DisplayRole:
-            if col == 0:  # 选择列不显示文本
-                return None
-            if col == 1:
-                return str(item.get("id", ""))
-            if col == 2:
-                return str(item.get("filename", ""))
-            if col == 3:
-                # 来源：数据库或文件路径
-                if item.get("material_id") and not item.get("xml_file"):
-                    return _('from_database')
-                elif item.get("xml_file"):
-                    return str(item.get("xml_file", ""))
-                else:
-                    return "-"
-            if col == 4:
-                return str(item.get("target_path", ""))
-            if col == 5:
-                return str(item.get("added_time", ""))
+            return self._rows[index.row()][col]
 
         if role == Qt.TextAlignmentRole:
             if col in [0, 1]:
@@ -117,6 +105,25 @@ class _AutoPackTableModel(QAbstractTableModel):
             return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
         return Qt.ItemIsSelectable | Qt.ItemIsEnabled
 
+    @staticmethod
+    def _build_row(item: Dict[str, Any]) -> tuple:
+        """构建一行的显示文本（选择列不显示文本）"""
+        # 来源：数据库或文件路径
+        if item.get("material_id") and not item.get("xml_file"):
+            source = _('from_database')
+        elif item.get("xml_file"):
+            source = str(item.get("xml_file", ""))
+        else:
+            source = "-"
+        return (
+            None,
+            str(item.get("id", "")),
+            str(item.get("filename", "")),
+            source,
+            str(item.get("target_path", "")),
+            item.get("added_time_display", ""),
+        )
+
     def get_item(self, row: int) -> Optional[Dict[str, Any]]:
         if 0 <= row < len(self._items):
             return self._items[row]
@@ -124,23 +131,14 @@ class _AutoPackTableModel(QAbstractTableModel):
 
     def get_selected_ids(self, selection_model) -> List[int]:
         """获取表格选中行的ID（用于行选择）"""
+        row_ids = self._ids
         rows = sorted({idx.row() for idx in selection_model.selectedRows()})
-        ids: List[int] = []
-        for r in rows:
-            item = self.get_item(r)
-            if item and isinstance(item.get("id"), int):
-                ids.append(item["id"])
-        return ids
+        return [row_ids[r] for r in rows if r < len(row_ids) and row_ids[r] is not None]
     
     def get_checked_ids(self) -> List[int]:
         """获取复选框勾选的项目ID（用于封包）"""
-        ids: List[int] = []
-        for i, checked in enumerate(self._checked):
-            if checked:
-                item = self.get_item(i)
-                if item and isinstance(item.get("id"), int):
-                    ids.append(item["id"])
-        return ids
+        return [item_id for item_id, checked in zip(self._ids, self._checked)
+                if checked and item_id is not None]
     
     def select_all(self, checked: bool = True):
         """全选/全不选"""
@@ -153,12 +151,84 @@ class _AutoPackTableModel(QAbstractTableModel):
                 [Qt.CheckStateRole]
             )
     
-    def load(self, items: List[Dict[str, Any]]):
-        """加载新数据"""
-        self.beginResetModel()
-        self._items = items or []
-        self._checked = [False] * len(self._items)  # 初始化选中状态
-        self.endResetModel()
+    def load(self, items: List[Dict[str, Any]]) -> bool:
+        """加载新数据（只对发生变化的行做增量更新，未变化行保留勾选状态），返回是否有行变化"""
+        items = items or []
+        ids = [item.get("id") if isinstance(item.get("id"), int) else None for item in items]
+        rows = [self._build_row(item) for item in items]
+
+        change = diff_row_range(self._rows, rows)
+        if change is None:
+            self._items, self._ids = items, ids
+            return False
+        start, old_end, new_end = change
+
+        if old_end - start == new_end - start:
+            # 行数不变：原地刷新变化的行
+            self._items, self._ids, self._rows = items, ids, rows
+            self.dataChanged.emit(self.index(start, 0), self.index(new_end - 1, len(self.COLS) - 1))
+            return True
+
+        if old_end > start:
+            self.beginRemoveRows(QModelIndex(), start, old_end - 1)
+            del self._items[start:old_end]
+            del self._ids[start:old_end]
+            del self._rows[start:old_end]
+            del self._checked[start:old_end]
+            self.endRemoveRows()
+        if new_end > start:
+            self.beginInsertRows(QModelIndex(), start, new_end - 1)
+            self._checked[start:start] = [False] * (new_end - start)
+            self._items, self._ids, self._rows = items, ids, rows
+            self.endInsertRows()
+        else:
+            self._items, self._ids, self._rows = items, ids, rows
+        return True
+
+
+class _AutoPackWorker(QThread):
+    """后台执行自动封包的工作线程
+
+    复制进度先放入队列，只有在主线程尚未安排刷新时才发出一次信号，
+    主线程一次性取出全部进度后只刷新一次界面，避免逐文件刷屏。
+    """
+    finishedResult = Signal(dict)
+    progressReady = Signal()
+
+    def __init__(self, manager: AutoPackManager, base_dir: str, selected_ids: List[int]):
+        super().__init__()
+        self._manager = manager
+        self._base_dir = base_dir
+        self._selected_ids = selected_ids
+        self._progress_q: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self._progress_pending = False
+
+    def _progress_callback(self, done: int, total: int):
+        self._progress_q.put((done, total))
+        if not self._progress_pending:
+            self._progress_pending = True
+            self.progressReady.emit()
+
+    def drain_progress(self) -> Optional[tuple]:
+        """取出全部排队的进度（主线程调用），返回最新一条"""
+        self._progress_pending = False
+        latest = None
+        while True:
+            try:
+                latest = self._progress_q.get_nowait()
+            except queue.Empty:
+                return latest
+
+    def run(self):
+        try:
+            result = self._manager.execute_autopack(
+                self._base_dir,
+                self._selected_ids,
+                progress_callback=self._progress_callback,
+            )
+        except Exception as exc:
+            result = {"success": False, "error": str(exc)}
+        self.finishedResult.emit(result)
 
 
 class AutoPackDialogQt(QDialog):
@@ -180,6 +250,8 @@ class AutoPackDialogQt(QDialog):
 
         self.manager = manager or AutoPackManager()
         self.model = _AutoPackTableModel([])
+        self._worker: Optional[_AutoPackWorker] = None
+        self._messages = MessageDialogPool(self)
 
         self._build_ui()
         self.reload()
@@ -311,15 +383,15 @@ class AutoPackDialogQt(QDialog):
         refresh_btn.clicked.connect(self.reload)
         btn_row.addWidget(refresh_btn)
 
-        exec_btn = QPushButton(_('execute_pack'))
-        apply_button_style(exec_btn, 'solid-blue')
-        exec_btn.clicked.connect(self._execute)
-        btn_row.addWidget(exec_btn)
+        self.exec_btn = QPushButton(_('execute_pack'))
+        apply_button_style(self.exec_btn, 'solid-blue')
+        self.exec_btn.clicked.connect(self._execute)
+        btn_row.addWidget(self.exec_btn)
 
-        close_btn = QPushButton(_('close'))
-        apply_button_style(close_btn, 'glass')
-        close_btn.clicked.connect(self.accept)
-        btn_row.addWidget(close_btn)
+        self.close_btn = QPushButton(_('close'))
+        apply_button_style(self.close_btn, 'glass')
+        self.close_btn.clicked.connect(self.accept)
+        btn_row.addWidget(self.close_btn)
 
         layout.addLayout(btn_row)
 
@@ -337,12 +409,14 @@ class AutoPackDialogQt(QDialog):
 
     def reload(self):
         items = self.manager.get_pending_list()
-        self.model.load(items)
+        changed = self.model.load(items)
         stats = self.manager.get_statistics()
-        self.stats_label.setText(
-            _('autopack_pending').format(stats.get('total_pending', 0), stats.get('with_target_path', 0), stats.get('without_target_path', 0))
-        )
-        self.table.resizeColumnsToContents()
+        stats_text = _fmt('autopack_pending', stats.get('total_pending', 0), stats.get('with_target_path', 0), stats.get('without_target_path', 0))
+        # 统计文字和表格内容都未变化时（如重复点击刷新）不重设标签、不重新计算列宽
+        if stats_text != self.stats_label.text():
+            self.stats_label.setText(stats_text)
+        if changed:
+            self.table.resizeColumnsToContents()
 
     def _add_xml(self):
         files, _unused = QFileDialog.getOpenFileNames(self, _('select_xml_to_pack'), filter="XML Files (*.xml)")
@@ -358,14 +432,14 @@ class AutoPackDialogQt(QDialog):
                 failed.append(f"{f}: {exc}")
         self.reload()
         if failed:
-            QMessageBox.warning(self, _('partial_failure'), "\n".join(failed[:10]))
+            self._messages.warning(_('partial_failure'), "\n".join(failed[:10]))
         else:
-            QMessageBox.information(self, _('complete'), _('added_xml_count').format(ok))
+            self._messages.info(_('complete'), _fmt('added_xml_count', ok))
 
     def _set_target_path(self):
         ids = self.model.get_selected_ids(self.table.selectionModel())
         if not ids:
-            QMessageBox.information(self, _('set_target_path_title'), _('select_at_least_one'))
+            self._messages.info(_('set_target_path_title'), _('select_at_least_one'))
             return
         text, ok = QFileDialog.getExistingDirectory(self, _('select_target_dir')), True
         if not ok or not text:
@@ -386,7 +460,7 @@ class AutoPackDialogQt(QDialog):
         # 获取勾选的项目
         checked_ids = self.model.get_checked_ids()
         if not checked_ids:
-            QMessageBox.information(self, _('pack_execute_title'), _('select_at_least_one'))
+            self._messages.info(_('pack_execute_title'), _('select_at_least_one'))
             return
         
         base_dir = self.base_pack_dir_edit.text().strip()
@@ -396,22 +470,47 @@ class AutoPackDialogQt(QDialog):
                 return
             self.base_pack_dir_edit.setText(base_dir)
 
-        try:
-            # 传入勾选的项目ID列表
-            result = self.manager.execute_autopack(base_dir, checked_ids)
-            if result.get("success"):
-                QMessageBox.information(
-                    self,
-                    _('pack_execute_title'),
-                    _('pack_execute_msg').format(result.get('packed_count', 0), result.get('failed_count', 0)),
-                )
-            else:
-                QMessageBox.warning(
-                    self,
-                    _('pack_execute_fail_title'),
-                    str(result.get("error") or _('unknown_error')),
-                )
-        except Exception as exc:
-            QMessageBox.warning(self, _('pack_execute_fail_title'), str(exc))
-        finally:
-            self.reload()
+        self._set_busy(True)
+        self._worker = _AutoPackWorker(self.manager, base_dir, checked_ids)
+        self._worker.progressReady.connect(self._drain_progress)
+        self._worker.finishedResult.connect(self._on_pack_finished)
+        self._worker.start()
+
+    def _set_busy(self, busy: bool):
+        self.exec_btn.setEnabled(not busy)
+        self.close_btn.setEnabled(not busy)
+        if busy:
+            self.stats_label.setText(_('packing_in_progress'))
+
+    def _drain_progress(self):
+        """合并刷新封包进度：一次取出全部排队的进度，只更新一次标签"""
+        if self._worker is None:
+            return
+        latest = self._worker.drain_progress()
+        if latest:
+            done, total = latest
+            self.stats_label.setText(f"{_('packing_in_progress')}  {done} / {total}")
+
+    def _on_pack_finished(self, result: Dict[str, Any]):
+        # 信号发出后线程即将退出，等待其结束再释放引用
+        if self._worker is not None:
+            self._worker.wait()
+            self._worker = None
+        self._set_busy(False)
+        if result.get("success"):
+            self._messages.info(
+                _('pack_execute_title'),
+                _fmt('pack_execute_msg', result.get('packed_count', 0), result.get('failed_count', 0)),
+            )
+        else:
+            self._messages.warning(
+                _('pack_execute_fail_title'),
+                str(result.get("error") or _('unknown_error')),
+            )
+        self.reload()
+
+    def reject(self):
+        # 封包进行中不允许关闭对话框
+        if self._worker is not None:
+            return
+        super().reject()
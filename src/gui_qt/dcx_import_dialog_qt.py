@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import queue
 from typing import Optional, Dict, Any
 
 from PySide6.QtCore import Qt, QThread, Signal, QTimer
@@ -18,14 +19,21 @@ from PySide6.QtWidgets import (
     QWidget,
     QGroupBox,
 )
-from src.core.i18n import _
+from src.core.i18n import _, _fmt
 
+# 库描述最大长度（字符），超出时提示用户精简，避免粘贴超大文本时整段复制到 Python
+MAX_DESCRIPTION_LENGTH = 4000
+
+# 导入进度轮询间隔（毫秒）
+PROGRESS_POLL_INTERVAL_MS = 50
 
 
 class _DCXImportWorker(QThread):
-    """带进度回调的DCX导入工作线程"""
+    """带进度回调的DCX导入工作线程
+
+    进度不再逐文件发信号，而是放入队列，由对话框定时取出最新一条刷新界面。
+    """
     finishedResult = Signal(dict)
-    progressUpdate = Signal(str, int, int)  # (阶段名称, 当前进度, 总数)
 
     def __init__(self, database, dcx_file: str, library_name: str, description: str):
         super().__init__()
@@ -33,12 +41,33 @@ class _DCXImportWorker(QThread):
         self._dcx_file = dcx_file
         self._library_name = library_name
         self._description = description
+        self._progress_q: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
 
     def _progress_callback(self, stage: str, current: int, total: int):
-        """进度回调，从后台线程发送信号到主线程"""
-        self.progressUpdate.emit(stage, current, total)
+        """进度回调（后台线程），(阶段名称, 当前进度, 总数) 放入队列"""
+        self._progress_q.put((stage, current, total))
+
+    def drain_progress(self) -> Optional[tuple]:
+        """取出全部排队的进度（主线程调用），返回最新一条"""
+        latest = None
+        while True:
+            try:
+                latest = self._progress_q.get_nowait()
+            except queue.Empty:
+                return latest
 
     def run(self):
+        # 路径存在性检查放在工作线程中，避免冷启动磁盘/网络路径卡住界面
+        if not os.path.exists(self._dcx_file):
+            self.finishedResult.emit(
+                {
+                    "success": False,
+                    "error": _('file_not_found') + f": {self._dcx_file}",
+                    "library_id": None,
+                    "material_count": 0,
+                }
+            )
+            return
         try:
             from src.core.witchybnd_processor import MaterialLibraryImporter
 
@@ -72,7 +101,7 @@ class DCXImportDialogQt(QDialog):
     """Qt版 DCX 材质库导入对话框。
 
     特性：
-    - 选择 DCX 文件
+    - 选择 DCX 文件（支持直接拖放到对话框）
     - 输入库名称/描述
     - 显示详细的分阶段进度
     - 动态进度条动画
@@ -101,8 +130,16 @@ class DCXImportDialogQt(QDialog):
         self._animation_direction = 1
         self._current_stage = ""
         self._has_real_progress = False
+        # 窗口隐藏/最小化时暂停的动画（重新显示时恢复）
+        self._animation_paused = False
+
+        # 进度轮询定时器
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(PROGRESS_POLL_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._pump_progress)
 
         self._build_ui()
+        self.setAcceptDrops(True)
 
     def initialize(self, path: str = "", name: str = "", desc: str = ""):
         """初始化预设值（用于从外部调用，如'从文件夹导入'）"""
@@ -234,6 +271,34 @@ class DCXImportDialogQt(QDialog):
             base = os.path.splitext(os.path.basename(file_path))[0]
             self.name_edit.setText(base)
 
+    @staticmethod
+    def _dropped_path(event) -> str:
+        """从拖放事件中取出第一个本地路径（不访问文件系统）"""
+        mime = event.mimeData()
+        if not mime.hasUrls():
+            return ""
+        for url in mime.urls():
+            if url.isLocalFile():
+                return url.toLocalFile()
+        return ""
+
+    def dragEnterEvent(self, event):
+        if self.start_btn.isEnabled() and self._dropped_path(event):
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+
+    def dropEvent(self, event):
+        path = self._dropped_path(event)
+        if not path:
+            event.ignore()
+            return
+        event.acceptProposedAction()
+        self.dcx_path_edit.setText(path)
+        if not self.name_edit.text().strip():
+            base = os.path.splitext(os.path.basename(path.rstrip("/\\")))[0]
+            self.name_edit.setText(base)
+
     def _start_animation(self):
         """启动进度条动画（用于没有实际进度的阶段）"""
         if self._animation_timer is None:
@@ -247,11 +312,26 @@ class DCXImportDialogQt(QDialog):
         
     def _stop_animation(self):
         """停止进度条动画"""
+        self._animation_paused = False
         if self._animation_timer:
             self._animation_timer.stop()
         # 恢复正常模式
         self.progress.setTextVisible(True)
             
+    def hideEvent(self, event):
+        """窗口隐藏或最小化：暂停进度条动画，避免无意义的定时器唤醒"""
+        super().hideEvent(event)
+        if self._animation_timer and self._animation_timer.isActive():
+            self._animation_timer.stop()
+            self._animation_paused = True
+
+    def showEvent(self, event):
+        """窗口重新显示：恢复之前暂停的进度条动画"""
+        super().showEvent(event)
+        if self._animation_paused:
+            self._animation_paused = False
+            self._animation_timer.start()
+
     def _animate_progress(self):
         """进度条动画效果 - 自定义循环移动（从左到右循环）"""
         if self._has_real_progress:
@@ -280,6 +360,14 @@ class DCXImportDialogQt(QDialog):
             self.stage_label.setText(_('waiting_start'))
             self.progress_label.setText("")
 
+    def _pump_progress(self):
+        """定时取出工作线程排队的进度，只按最新一条刷新界面"""
+        if self._worker is None:
+            return
+        latest = self._worker.drain_progress()
+        if latest:
+            self._on_progress(*latest)
+
     def _on_progress(self, stage: str, current: int, total: int):
         """处理进度更新"""
         # 翻译阶段名称 - 使用 i18n 翻译键
@@ -310,28 +398,43 @@ class DCXImportDialogQt(QDialog):
                 self._start_animation()
             self.progress_label.setText(_('processing'))
 
+    def _read_description(self) -> Optional[str]:
+        """读取描述文本；超过上限时提示用户精简并返回 None（不截断用户输入）"""
+        length = self.desc_edit.document().characterCount() - 1  # 末尾的段落分隔符不计入
+        if length > MAX_DESCRIPTION_LENGTH:
+            QMessageBox.warning(
+                self,
+                _('import_dcx_title'),
+                _fmt('description_too_long', length=length, max=MAX_DESCRIPTION_LENGTH),
+            )
+            return None
+        return self.desc_edit.toPlainText().strip()
+
     def _start(self):
         dcx_file = self.dcx_path_edit.text().strip()
         lib_name = self.name_edit.text().strip()
-        desc = self.desc_edit.toPlainText().strip()
 
         if not dcx_file:
             QMessageBox.warning(self, _('import_dcx_title'), _('please_select_dcx_file'))
             return
-        if not os.path.exists(dcx_file):
-            QMessageBox.warning(self, _('import_dcx_title'), _('file_not_found') + f": {dcx_file}")
-            return
         if not lib_name:
             QMessageBox.warning(self, _('import_dcx_title'), _('please_input_library_name'))
             return
+        desc = self._read_description()
+        if desc is None:
+            return
 
         self._set_busy(True)
         self._worker = _DCXImportWorker(self._database, dcx_file, lib_name, desc)
-        self._worker.progressUpdate.connect(self._on_progress)
         self._worker.finishedResult.connect(self._on_finished)
         self._worker.start()
+        self._progress_timer.start()
 
     def _on_finished(self, result: Dict[str, Any]):
+        self._progress_timer.stop()
+        if self._worker is not None:
+            self._worker.wait()
+            self._worker = None
         self._set_busy(False)
 
         if result.get("success"):
@@ -110,7 +110,7 @@ def create_busy_progress(parent, title: str, label: str) -> QProgressDialog:
 class ImportSingleXmlDialog(QDialog):
     """单XML文件导入对话框：预览并编辑信息，选择目标库。"""
 
-    def __init__(self, parent, db, material_data, current_lib_id=None):
+    def __init__(self, parent, db, material_data, current_lib_id=None, libraries=None):
         super().__init__(parent)
         self.db = db
         self.material_data = material_data.copy() # Work on a copy
@@ -159,7 +159,8 @@ class ImportSingleXmlDialog(QDialog):
         # 4. 库选择
         layout.addWidget(QLabel(_('target_library')))
         self.combo = QComboBox()
-        libs = self.db.get_libraries()
+        # 调用方已持有库列表时直接使用，避免再查询一次数据库
+        libs = libraries if libraries is not None else self.db.get_libraries()
         current_idx = 0
         for i, lib in enumerate(libs):
             self.combo.addItem(lib['name'], lib['id'])
@@ -222,9 +223,10 @@ class ImportSingleXmlDialog(QDialog):
         # Update material_data
         self.material_data['filename'] = name_input
         self.material_data['file_name'] = name_input # Sync logic name
-        self.material_data['file_path'] = self.path_edit.text().strip()
+        file_path = self.path_edit.text().strip()
+        self.material_data['file_path'] = file_path
         # 同步更新 source_path (用户编辑的文件路径实际上是 SourcePath)
-        self.material_data['source_path'] = self.path_edit.text().strip()
+        self.material_data['source_path'] = file_path
         self.material_data['shader_path'] = self.shader_edit.text().strip()
 
         # Library selection
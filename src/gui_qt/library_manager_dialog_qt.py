@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 
-from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal, QTimer
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -19,6 +19,7 @@ from PySide6.QtWidgets import (
 )
 
 from src.core.i18n import _
+from src.gui_qt.models import diff_row_range
 
 
 
@@ -28,6 +29,11 @@ class _LibraryRow:
     name: str
     source_path: str
     material_count: int
+    # 数量列的显示文本，构造时生成一次，避免每次绘制都 str()
+    count_text: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'count_text', str(self.material_count))
 
 
 class _LibraryTableModel(QAbstractTableModel):
@@ -38,6 +44,12 @@ class _LibraryTableModel(QAbstractTableModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._rows: List[_LibraryRow] = []
+        self._headers = ("", "", "")
+
+    def set_headers(self, name: str, path: str, count: str):
+        """设置表头文本（由对话框从缓存的翻译中提供）"""
+        self._headers = (name, path, count)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._headers) - 1)
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
         return 0 if parent.isValid() else len(self._rows)
@@ -48,12 +60,8 @@ class _LibraryTableModel(QAbstractTableModel):
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):  # type: ignore[override]
         if role != Qt.DisplayRole or orientation != Qt.Horizontal:
             return None
-        if section == self.COL_NAME:
-            return _('library_name_column')
-        if section == self.COL_PATH:
-            return _('library_path_column')
-        if section == self.COL_COUNT:
-            return _('material_count_column')
+        if 0 <= section < len(self._headers):
+            return self._headers[section]
         return None
 
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole):  # type: ignore[override]
@@ -67,7 +75,7 @@ class _LibraryTableModel(QAbstractTableModel):
             if index.column() == self.COL_PATH:
                 return row.source_path
             if index.column() == self.COL_COUNT:
-                return str(row.material_count)
+                return row.count_text
 
         if role == Qt.TextAlignmentRole:
             if index.column() == self.COL_COUNT:
@@ -77,9 +85,27 @@ class _LibraryTableModel(QAbstractTableModel):
         return None
 
     def load_rows(self, rows: List[_LibraryRow]):
-        self.beginResetModel()
-        self._rows = rows
-        self.endResetModel()
+        """增量更新：只替换发生变化的行，保留选中与滚动位置"""
+        change = diff_row_range(self._rows, rows)
+        if change is None:
+            return
+        start, old_end, new_end = change
+
+        if old_end - start == new_end - start:
+            self._rows = rows
+            self.dataChanged.emit(self.index(start, 0), self.index(new_end - 1, self.COL_COUNT))
+            return
+
+        if old_end > start:
+            self.beginRemoveRows(QModelIndex(), start, old_end - 1)
+            self._rows = self._rows[:start] + self._rows[old_end:]
+            self.endRemoveRows()
+        if new_end > start:
+            self.beginInsertRows(QModelIndex(), start, new_end - 1)
+            self._rows = rows
+            self.endInsertRows()
+        else:
+            self._rows = rows
 
     def library_id_at(self, row: int) -> Optional[int]:
         if row < 0 or row >= len(self._rows):
@@ -92,6 +118,46 @@ class _LibraryTableModel(QAbstractTableModel):
         return self._rows[row]
 
 
+# 对话框界面使用的翻译键（打开对话框时一次性翻译并缓存）
+_LABEL_KEYS = (
+    'library_manager_button',
+    'library_name_column',
+    'library_path_column',
+    'material_count_column',
+    'add_library_button_ellipsis',
+    'menu_refresh',
+    'menu_edit',
+    'move_up',
+    'move_down',
+    'delete',
+    'close',
+    # 编辑库对话框
+    'edit_library',
+    'library_name_placeholder',
+    'library_path_label',
+    'browse_button',
+    'library_description',
+    'description_placeholder',
+    'select_library_path',
+    'cancel',
+    'save',
+    'edit_library_title',
+    # 提示信息
+    'error',
+    'info',
+    'db_sort_not_supported',
+    'delete_library',
+    'delete_library_confirm_msg',
+    'db_delete_not_supported',
+    'delete_failed',
+    'add_library',
+    'cannot_get_library_info',
+    'library_name_empty',
+    'update_path_not_supported',
+    'save_failed',
+)
+
+
 class LibraryManagerDialogQt(QDialog):
     """Qt 版“库管理”对话框：三列表 + 刷新/重扫/删除/关闭。
 
@@ -111,8 +177,7 @@ class LibraryManagerDialogQt(QDialog):
         
         self._version_tag = version_tag
         self._add_library_callback = add_library_callback
-        title = _('library_manager_button')
-        self.setWindowTitle(title)
+        self._load_labels()
         self.resize(760, 520)
 
         self._db = database
@@ -120,17 +185,42 @@ class LibraryManagerDialogQt(QDialog):
 
         self._model = _LibraryTableModel(self)
 
+        # 合并刷新：同一轮事件循环内的多次修改只刷新一次列表、通知一次外部
+        self._pending_select_row: Optional[int] = None
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+
         self._build_ui()
+        self._apply_translations()
         self.reload()
 
+    def _load_labels(self):
+        """翻译并缓存界面文本（对话框每次打开时重建，语言在其生命周期内不变）"""
+        self._labels = {key: _(key) for key in _LABEL_KEYS}
+
+    def _apply_translations(self):
+        """按控件→翻译键映射设置界面文本"""
+        labels = self._labels
+        self.setWindowTitle(labels['library_manager_button'])
+        self.title_label.setText(labels['library_manager_button'])
+        self._model.set_headers(
+            labels['library_name_column'],
+            labels['library_path_column'],
+            labels['material_count_column'],
+        )
+        for btn, key in self._button_keys.items():
+            btn.setText(labels[key])
+
     def _build_ui(self):
         root = QVBoxLayout(self)
         root.setContentsMargins(14, 12, 14, 12)
         root.setSpacing(10)
 
-        title = QLabel(self.windowTitle())
-        title.setStyleSheet("font-weight:600; font-size:14px;")
-        root.addWidget(title)
+        self.title_label = QLabel()
+        self.title_label.setStyleSheet("font-weight:600; font-size:14px;")
+        root.addWidget(self.title_label)
 
         self.table = QTableView()
         self.table.setModel(self._model)
@@ -150,7 +240,12 @@ class LibraryManagerDialogQt(QDialog):
         header.setSectionResizeMode(_LibraryTableModel.COL_NAME, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(_LibraryTableModel.COL_PATH, QHeaderView.Stretch)
         header.setSectionResizeMode(_LibraryTableModel.COL_COUNT, QHeaderView.ResizeToContents)
-        self.table.verticalHeader().setVisible(False)
+        # 库很多时只按可见行计算列宽，行高固定，避免每次布局都测量全部行
+        header.setResizeContentsPrecision(0)
+        vheader = self.table.verticalHeader()
+        vheader.setSectionResizeMode(QHeaderView.Fixed)
+        vheader.setDefaultSectionSize(self.table.fontMetrics().height() + 10)
+        vheader.setVisible(False)
         self.table.doubleClicked.connect(lambda _idx: self._on_edit())
 
         root.addWidget(self.table, 1)
@@ -159,17 +254,17 @@ class LibraryManagerDialogQt(QDialog):
         btn_row.setSpacing(8)
         root.addLayout(btn_row)
 
-        self.add_btn = QPushButton(_('add_library_button_ellipsis'))
+        self.add_btn = QPushButton()
         self.add_btn.setObjectName("glass")
-        self.refresh_btn = QPushButton(_('menu_refresh'))
+        self.refresh_btn = QPushButton()
         self.refresh_btn.setObjectName("glass")
-        self.edit_btn = QPushButton(_('menu_edit'))
+        self.edit_btn = QPushButton()
         self.edit_btn.setObjectName("glass")
-        self.move_up_btn = QPushButton(_('move_up'))
+        self.move_up_btn = QPushButton()
         self.move_up_btn.setObjectName("green-glass")
-        self.move_down_btn = QPushButton(_('move_down'))
+        self.move_down_btn = QPushButton()
         self.move_down_btn.setObjectName("pink-glass")
-        self.delete_btn = QPushButton(_('delete'))
+        self.delete_btn = QPushButton()
         self.delete_btn.setObjectName("danger")
         btn_row.addWidget(self.add_btn)
         btn_row.addWidget(self.refresh_btn)
@@ -178,10 +273,21 @@ class LibraryManagerDialogQt(QDialog):
         btn_row.addWidget(self.move_down_btn)
         btn_row.addWidget(self.delete_btn)
         btn_row.addStretch(1)
-        self.close_btn = QPushButton(_('close'))
+        self.close_btn = QPushButton()
         self.close_btn.setObjectName("glass")
         btn_row.addWidget(self.close_btn)
 
+        # 按钮 → 翻译键
+        self._button_keys = {
+            self.add_btn: 'add_library_button_ellipsis',
+            self.refresh_btn: 'menu_refresh',
+            self.edit_btn: 'menu_edit',
+            self.move_up_btn: 'move_up',
+            self.move_down_btn: 'move_down',
+            self.delete_btn: 'delete',
+            self.close_btn: 'close',
+        }
+
         self.add_btn.clicked.connect(self._on_add_library)
         self.refresh_btn.clicked.connect(self.reload)
         self.edit_btn.clicked.connect(self._on_edit)
@@ -196,21 +302,28 @@ class LibraryManagerDialogQt(QDialog):
 
     def reload(self):
         rows: List[_LibraryRow] = []
-        for lib in self._safe_get_libraries():
+        # 库列表与材质数量一次 JOIN 查询取回，避免每个库单独计数
+        try:
+            libs = self._db.get_libraries_with_counts() or []
+        except Exception:
+            libs = []
+        for lib in libs:
             lid = lib.get("id")
             if lid is None:
                 continue
             name = lib.get("name") or ""
             src = lib.get("source_path") or lib.get("path") or ""
-            try:
-                count = int(self._db.get_material_count(lid))
-            except Exception:
-                count = 0
+            count = int(lib.get("material_count") or 0)
             rows.append(_LibraryRow(id=int(lid), name=str(name), source_path=str(src), material_count=count))
 
-        self._model.load_rows(rows)
-        if rows:
-            self.table.selectRow(0)
+        # 批量更新期间暂停表格重绘，结束后统一绘制一次
+        self.table.setUpdatesEnabled(False)
+        try:
+            self._model.load_rows(rows)
+            if rows and not self.table.currentIndex().isValid():
+                self.table.selectRow(0)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
     def _safe_get_libraries(self) -> List[Dict[str, Any]]:
         try:
@@ -262,15 +375,13 @@ class LibraryManagerDialogQt(QDialog):
             if hasattr(self._db, "swap_library_order"):
                 self._db.swap_library_order(current_lib.id, prev_lib.id)
             else:
-                QMessageBox.warning(self, _('error'), _('db_sort_not_supported'))
+                QMessageBox.warning(self, self._labels['error'], self._labels['db_sort_not_supported'])
                 return
         except Exception as exc:
-            QMessageBox.warning(self, _('error'), str(exc))
+            QMessageBox.warning(self, self._labels['error'], str(exc))
             return
         
-        self.reload()
-        self.table.selectRow(current_row - 1)
-        self._emit_changed()
+        self._schedule_refresh(select_row=current_row - 1)
 
     def _on_move_down(self):
         """将当前选中的库下移一位"""
@@ -290,15 +401,13 @@ class LibraryManagerDialogQt(QDialog):
             if hasattr(self._db, "swap_library_order"):
                 self._db.swap_library_order(current_lib.id, next_lib.id)
             else:
-                QMessageBox.warning(self, _('error'), _('db_sort_not_supported'))
+                QMessageBox.warning(self, self._labels['error'], self._labels['db_sort_not_supported'])
                 return
         except Exception as exc:
-            QMessageBox.warning(self, _('error'), str(exc))
+            QMessageBox.warning(self, self._labels['error'], str(exc))
             return
         
-        self.reload()
-        self.table.selectRow(current_row + 1)
-        self._emit_changed()
+        self._schedule_refresh(select_row=current_row + 1)
 
     def _on_delete(self):
         row = self._selected_library_row()
@@ -308,8 +417,8 @@ class LibraryManagerDialogQt(QDialog):
         from src.gui_qt.standard_dialogs import show_confirm_dialog
         ok = show_confirm_dialog(
             self,
-            _('delete_library'),
-            _('delete_library_confirm_msg').format(row.name),
+            self._labels['delete_library'],
+            self._labels['delete_library_confirm_msg'].format(row.name),
             confirm_style='danger'
         )
         if not ok:
@@ -321,13 +430,12 @@ class LibraryManagerDialogQt(QDialog):
             elif hasattr(self._db, "remove_library"):
                 self._db.remove_library(row.id)
             else:
-                raise RuntimeError(_('db_delete_not_supported'))
+                raise RuntimeError(self._labels['db_delete_not_supported'])
         except Exception as exc:
-            QMessageBox.warning(self, _('delete_failed'), str(exc))
+            QMessageBox.warning(self, self._labels['delete_failed'], str(exc))
             return
 
-        self.reload()
-        self._emit_changed()
+        self._schedule_refresh()
 
     def _on_add_library(self):
         if not callable(self._add_library_callback):
@@ -335,16 +443,16 @@ class LibraryManagerDialogQt(QDialog):
         try:
             self._add_library_callback()
         except Exception as exc:
-            QMessageBox.warning(self, _('add_library'), str(exc))
+            QMessageBox.warning(self, self._labels['add_library'], str(exc))
             return
         # 导入可能是后台线程；这里先刷新一次，导入完成后主窗口也会刷新。
-        self.reload()
-        self._emit_changed()
+        self._schedule_refresh()
 
     def _on_edit(self):
         row = self._selected_library_row()
         if row is None:
             return
+        labels = self._labels
 
         raw = None
         for lib in self._safe_get_libraries():
@@ -352,44 +460,44 @@ class LibraryManagerDialogQt(QDialog):
                 raw = lib
                 break
         if raw is None:
-            QMessageBox.warning(self, _('edit_library'), _('cannot_get_library_info'))
+            QMessageBox.warning(self, labels['edit_library'], labels['cannot_get_library_info'])
             return
 
         dlg = QDialog(self)
-        dlg.setWindowTitle(_('edit_library'))
+        dlg.setWindowTitle(labels['edit_library'])
         dlg.resize(620, 320)
 
         root = QVBoxLayout(dlg)
         root.setContentsMargins(14, 12, 14, 12)
         root.setSpacing(10)
 
-        title = QLabel(_('edit_library_title').format(name=raw.get('name', '')))
+        title = QLabel(labels['edit_library_title'].format(name=raw.get('name', '')))
         title.setStyleSheet("font-weight:600; font-size:14px;")
         root.addWidget(title)
 
-        root.addWidget(QLabel(_('library_name_column')))
+        root.addWidget(QLabel(labels['library_name_column']))
         name_edit = QLineEdit(str(raw.get("name") or ""))
-        name_edit.setPlaceholderText(_('library_name_placeholder'))
+        name_edit.setPlaceholderText(labels['library_name_placeholder'])
         root.addWidget(name_edit)
 
-        root.addWidget(QLabel(_('library_path_label')))
+        root.addWidget(QLabel(labels['library_path_label']))
         path_row = QHBoxLayout()
         path_edit = QLineEdit(str(raw.get("source_path") or raw.get("path") or ""))
-        path_edit.setPlaceholderText(_('library_path_label'))
-        browse_btn = QPushButton(_('browse_button'))
+        path_edit.setPlaceholderText(labels['library_path_label'])
+        browse_btn = QPushButton(labels['browse_button'])
         browse_btn.setObjectName("glass")
         path_row.addWidget(path_edit, 1)
         path_row.addWidget(browse_btn)
         root.addLayout(path_row)
 
-        root.addWidget(QLabel(_('library_description')))
+        root.addWidget(QLabel(labels['library_description']))
         desc_edit = QTextEdit(str(raw.get("description") or ""))
-        desc_edit.setPlaceholderText(_('description_placeholder'))
+        desc_edit.setPlaceholderText(labels['description_placeholder'])
         desc_edit.setFixedHeight(90)
         root.addWidget(desc_edit)
 
         def choose_path():
-            p = QFileDialog.getExistingDirectory(dlg, _('select_library_path'))
+            p = QFileDialog.getExistingDirectory(dlg, labels['select_library_path'])
             if p:
                 path_edit.setText(p)
 
@@ -397,9 +505,9 @@ class LibraryManagerDialogQt(QDialog):
 
         btn_row = QHBoxLayout()
         btn_row.addStretch(1)
-        cancel_btn = QPushButton(_('cancel'))
+        cancel_btn = QPushButton(labels['cancel'])
         cancel_btn.setObjectName("glass")
-        ok_btn = QPushButton(_('save'))
+        ok_btn = QPushButton(labels['save'])
         ok_btn.setObjectName("primary")
         btn_row.addWidget(cancel_btn)
         btn_row.addWidget(ok_btn)
@@ -409,7 +517,7 @@ class LibraryManagerDialogQt(QDialog):
         def save():
             name = name_edit.text().strip()
             if not name:
-                QMessageBox.warning(dlg, _('edit_library'), _('library_name_empty'))
+                QMessageBox.warning(dlg, labels['edit_library'], labels['library_name_empty'])
                 return
             new_path = path_edit.text().strip()
             new_desc = desc_edit.toPlainText().strip()
@@ -418,17 +526,37 @@ class LibraryManagerDialogQt(QDialog):
             except TypeError:
                 # 兼容旧签名（若未更新 database.py）
                 self._db.update_library(row.id, name=name, description=new_desc)
-                QMessageBox.information(dlg, _('info'), _('update_path_not_supported'))
+                QMessageBox.information(dlg, labels['info'], labels['update_path_not_supported'])
             except Exception as exc:
-                QMessageBox.warning(dlg, _('save_failed'), str(exc))
+                QMessageBox.warning(dlg, labels['save_failed'], str(exc))
                 return
             dlg.accept()
 
         ok_btn.clicked.connect(save)
 
         if dlg.exec() == QDialog.Accepted:
-            self.reload()
-            self._emit_changed()
+            self._schedule_refresh()
+
+    def _schedule_refresh(self, select_row: Optional[int] = None):
+        """安排一次合并刷新（已有待执行的刷新时只更新要选中的行）"""
+        if select_row is not None:
+            self._pending_select_row = select_row
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _do_refresh(self):
+        select_row, self._pending_select_row = self._pending_select_row, None
+        self.reload()
+        if select_row is not None:
+            self.table.selectRow(select_row)
+        self._emit_changed()
+
+    def done(self, result: int):
+        # 关闭前执行尚未触发的刷新，保证主窗口同步
+        if self._refresh_timer.isActive():
+            self._refresh_timer.stop()
+            self._do_refresh()
+        super().done(result)
 
     def _emit_changed(self):
         try:
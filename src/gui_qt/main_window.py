@@ -3,24 +3,61 @@ from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QComboBox,
     QLabel, QPushButton, QToolBar, QToolButton, QMenu, QStatusBar,
     QSplitter, QFrame, QAbstractItemView, QApplication, QGridLayout,
-    QSizePolicy, QMessageBox, QDialog, QStackedLayout
+    QSizePolicy, QMessageBox, QDialog, QStackedLayout, QInputDialog, QFileDialog, QListView
 )
 from PySide6.QtCore import Qt, QEvent, QTimer, QThread, Signal
-from PySide6.QtGui import QIcon, QPixmap, QPalette, QColor, QKeySequence, QShortcut
+from PySide6.QtGui import QIcon, QPixmap, QPalette, QColor, QKeySequence, QShortcut, QCursor
+import copy
+import logging
 import os
 import sys
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 
 from .material_tree_panel import MaterialTreePanel
 from .material_editor_panel import MaterialEditorPanel
-from .models import LibraryListModel, MaterialListModel
-from .loading_overlay import LoadingOverlay
-from .about_dialog_qt import AboutDialog
-from src.core.database import MaterialDatabase
-from src.core.i18n import _, language_manager
-from src.core.version import get_version, get_build_date
+from .models import LibraryListModel, MaterialListModel, diff_row_range
+from src.core.database import (
+    MaterialDatabase, search_keyword_term, material_search_blob, filter_materials_by_term
+)
+from src.core.i18n import _, _fmt, language_manager
+from src.core.version import get_version
 from src.utils.resource_path import get_assets_path, ensure_data_dirs
 from .widgets.toast import toast
 
+logger = logging.getLogger(__name__)
+
+
+# 材质查询结果缓存的最大条目数
+MATERIAL_QUERY_CACHE_SIZE = 8
+# 材质详情缓存的最大条目数
+MATERIAL_DETAIL_CACHE_SIZE = 20
+
+# 关键字输入防抖间隔（毫秒）：能在上次结果中筛选或命中缓存时只是内存操作，间隔较短；
+# 需要查询数据库时间隔较长，把连续按键合并为一次查询
+SEARCH_REFINE_DEBOUNCE_MS = 100
+SEARCH_QUERY_DEBOUNCE_MS = 150
+
+# 各语言的“就绪”状态文字：切换语言时，状态栏显示其中之一（或为空）才替换为新语言的就绪文字
+_READY_TOKENS = frozenset(
+    table['status_ready'] for table in language_manager.translations.values() if 'status_ready' in table
+) | {''}
+
+
+def _intern_material(detail: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """驻留材质详情中参数/采样器的字符串字段（参数名、类型、贴图路径等在材质间大量重复），缓存多个材质时共享同一对象"""
+    if not detail:
+        return detail
+    intern = sys.intern
+    for key in ('params', 'samplers'):
+        for item in detail.get(key) or ():
+            if isinstance(item, dict):
+                for field, value in item.items():
+                    if type(value) is str:
+                        item[field] = intern(value)
+    return detail
+
 
 class SearchWorker(QThread):
     """后台线程执行数据库搜索，避免阻塞UI"""
@@ -43,7 +80,7 @@ class SearchWorker(QThread):
             )
             self.finished.emit(results)
         except Exception as e:
-            print(f"搜索错误: {e}")
+            logger.error(f"搜索错误: {str(e)}")
             import traceback
             traceback.print_exc()
             self.finished.emit([])
@@ -78,6 +115,13 @@ class CommandBar(QWidget):
         left_box.addWidget(self.library_label)
         self.library_combo = QComboBox()
         self.library_combo.setMinimumWidth(220)
+        # 库很多时：宽度按固定字符数计算，不逐项测量文字；弹出列表按统一行高批量布局
+        self.library_combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+        self.library_combo.setMinimumContentsLength(20)
+        self.library_combo.setMaxVisibleItems(20)
+        popup_view = self.library_combo.view()
+        popup_view.setUniformItemSizes(True)
+        popup_view.setLayoutMode(QListView.Batched)
         left_box.addWidget(self.library_combo)
         left_box.addStretch(1)
         layout.addLayout(left_box)
@@ -123,18 +167,66 @@ class MaterialDatabaseMainWindow(QMainWindow):
         self.library_model = LibraryListModel()
         self.material_model = MaterialListModel()
         self.current_library_id: Optional[int] = None
-        self.current_material: Optional[Dict[str, Any]] = None
+        # 当前选中材质只记录ID，详情由 LRU 缓存提供（见 current_material 属性）
+        self.current_material_id: Optional[int] = None
         
         # 搜索防抖定时器（延迟搜索以减少卡顿）
-        from PySide6.QtCore import QTimer
         self._search_timer = QTimer()
         self._search_timer.setSingleShot(True)
-        self._search_timer.setInterval(100)  # 100ms 延迟（减少等待时间）
-        self._search_timer.timeout.connect(self._do_search)
+        self._search_timer.setInterval(SEARCH_REFINE_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._on_search_timeout)
+        # 上次搜索结果缓存 (库ID, 关键字, 结果, 搜索文本)，继续输入时在其中筛选
+        self._search_cache = None
+        # 数据库查询结果 LRU 缓存 {(库ID, 关键字): (结果, 搜索文本)}，切回最近访问的库时无需查询
+        self._query_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        # 材质详情 LRU 缓存（按材质ID），重复点击同一材质时无需查询
+        self._fetch_material = lru_cache(maxsize=MATERIAL_DETAIL_CACHE_SIZE)(self._fetch_material_detail)
+        # 当前列表显示内容对应的 (库ID, 关键字)，相同请求不再重复刷新列表
+        self._rendered_token = None
+        # 材质列表面板隐藏期间推迟的加载请求 (关键字, refine)，面板重新显示时执行
+        self._pending_material_load = None
+        # 待显示的状态栏消息 (文本, 超时)，由 _set_status 合并后统一刷新
+        self._pending_status = None
+        self._status_scheduled = False
+
+        # 后台预热自动封包管理器（读取封包配置），首次打开封包对话框无需等待磁盘
+        self._autopack_manager = None
+        self._autopack_warmup = threading.Thread(target=self._warm_autopack_manager, daemon=True)
+        self._autopack_warmup.start()
+
+        # XML 解析器无状态，首次导入/导出时创建后复用
+        self._xml_parser = None
+        # 导入方式选择对话框，首次使用时创建后复用
+        self._import_mode_dialog = None
+        # 各控件最近一次设置的翻译文字（语言切换时跳过文字未变的控件）
+        self._widget_texts: Dict[Any, str] = {}
 
         self._build_ui()
         self._apply_translations()
 
+    def _warm_autopack_manager(self):
+        """后台线程：创建自动封包管理器并加载配置"""
+        try:
+            from src.core.autopack_manager import AutoPackManager
+            self._autopack_manager = AutoPackManager()
+        except Exception:
+            pass
+
+    def _get_autopack_manager(self):
+        """获取共享的自动封包管理器（预热未完成时等待，失败时现场创建）"""
+        self._autopack_warmup.join()
+        if self._autopack_manager is None:
+            from src.core.autopack_manager import AutoPackManager
+            self._autopack_manager = AutoPackManager()
+        return self._autopack_manager
+
+    def _get_xml_parser(self):
+        """获取共享的 XML 材质解析器（首次使用时创建）"""
+        if self._xml_parser is None:
+            from src.core.xml_parser import MaterialXMLParser
+            self._xml_parser = MaterialXMLParser()
+        return self._xml_parser
+
     def _set_dark_titlebar(self):
         """设置深色标题栏（Windows 10/11）"""
         try:
@@ -161,7 +253,7 @@ class MaterialDatabaseMainWindow(QMainWindow):
                     QTimer.singleShot(0, lambda: self._apply_dark_titlebar(set_dark_title_bar))
                     
                 except Exception as e:
-                    print(_('dark_titlebar_failed').format(e=e))
+                    logger.warning(_('dark_titlebar_failed').format(e=e))
         except Exception:
             pass
     
@@ -171,7 +263,7 @@ class MaterialDatabaseMainWindow(QMainWindow):
             hwnd = int(self.winId())
             set_func(hwnd)
         except Exception as e:
-            print(_('dark_titlebar_apply_failed').format(e=e))
+            logger.warning(_('dark_titlebar_apply_failed').format(e=e))
 
     # ---- UI building ----
     def _build_ui(self):
@@ -188,12 +280,12 @@ class MaterialDatabaseMainWindow(QMainWindow):
 
         # bind search and library change
         self.command_bar.library_combo.currentIndexChanged.connect(self._on_library_changed)
-        self.command_bar.search_btn.clicked.connect(self._on_search)
+        self.command_bar.search_btn.clicked.connect(lambda: self._do_search(force=True))
         self.command_bar.clear_btn.clicked.connect(self._on_clear_search)
         # typing triggers debounce search
         self.command_bar.search_edit.textChanged.connect(self._on_search)
         # enter to search immediately
-        self.command_bar.search_edit.returnPressed.connect(self._do_search)
+        self.command_bar.search_edit.returnPressed.connect(lambda: self._do_search(force=True))
         # esc clears input
         self.command_bar.search_edit.installEventFilter(self)
 
@@ -219,6 +311,8 @@ class MaterialDatabaseMainWindow(QMainWindow):
 
         self.left_panel = MaterialTreePanel()
         self.left_panel.set_model(self.material_model)
+        # 面板重新显示时补上隐藏期间推迟的列表刷新
+        self.left_panel.installEventFilter(self)
         self.left_panel.materialSelected.connect(self._on_material_selected)
         self.right_panel = MaterialEditorPanel()
         self.right_panel.saveRequested.connect(self._on_save_material)
@@ -235,14 +329,13 @@ class MaterialDatabaseMainWindow(QMainWindow):
 
         # status bar
         status = QStatusBar()
-        status.showMessage(_('status_ready'))
         self.setStatusBar(status)
 
         # menubar placeholder
         self._create_menubar()
 
-        # initial load
-        self._load_libraries()
+        # initial load：先让窗口完成首次绘制，再在事件循环空闲时查询数据库填充库列表
+        QTimer.singleShot(0, self._load_libraries)
 
     def _ui_call(self, fn):
         """线程安全：把回调投递到 Qt 主线程执行。"""
@@ -285,7 +378,6 @@ class MaterialDatabaseMainWindow(QMainWindow):
             layout.addWidget(self.glow_bg, 0, 0)
             
             # 2. 顶部按钮层（不应用发光，保持文字清晰）
-            from PySide6.QtWidgets import QToolButton, QPushButton
             if is_tool_button:
                 self.btn = QToolButton()
             else:
@@ -319,39 +411,73 @@ class MaterialDatabaseMainWindow(QMainWindow):
 
     def _create_menubar(self):
         menubar = self.menuBar()
+        # 菜单文字统一由 _apply_translations 设置（构建后立即调用），这里不重复查找翻译
         
         # 文件菜单
-        self.menu_file = menubar.addMenu(_('menu_file'))
-        self.act_import = self.menu_file.addAction(_('menu_import'), self._on_import_library)
-        self.act_export = self.menu_file.addAction(_('menu_export_material'), self._on_export_material)
-        self.act_autopack = self.menu_file.addAction(_('menu_autopack'), self._on_auto_pack)
+        self.menu_file = menubar.addMenu('')
+        self.act_import = self.menu_file.addAction('', self._on_import_library)
+        self.act_export = self.menu_file.addAction('', self._on_export_material)
+        self.act_autopack = self.menu_file.addAction('', self._on_auto_pack)
         self.menu_file.addSeparator()
-        self.act_exit = self.menu_file.addAction(_('menu_exit'), self.close)
+        self.act_exit = self.menu_file.addAction('', self.close)
 
         # 编辑菜单
-        self.menu_edit = menubar.addMenu(_('menu_edit'))
-        self.act_refresh = self.menu_edit.addAction(_('menu_refresh'), self._refresh_library_list)
-        self.act_clear_search = self.menu_edit.addAction(_('menu_clear_search'), self._on_clear_search)
+        self.menu_edit = menubar.addMenu('')
+        self.act_refresh = self.menu_edit.addAction('', self._refresh_library_list)
+        self.act_clear_search = self.menu_edit.addAction('', self._on_clear_search)
 
         # 工具菜单
-        self.menu_tools = menubar.addMenu(_('menu_tools'))
-        self.act_match = self.menu_tools.addAction(_('material_matching_button'), self._on_open_material_matching)
-        self.act_adv_search = self.menu_tools.addAction(_('advanced_search_button'), self._on_open_advanced_search)
+        self.menu_tools = menubar.addMenu('')
+        self.act_match = self.menu_tools.addAction('', self._on_open_material_matching)
+        self.act_adv_search = self.menu_tools.addAction('', self._on_open_advanced_search)
 
         # 视图菜单
-        self.menu_view = menubar.addMenu(_('menu_view'))
-        self.act_toggle_sidebar = self.menu_view.addAction(_('menu_toggle_sidebar'), self._toggle_sidebar)
-        self.act_toggle_samplers = self.menu_view.addAction(_('menu_toggle_samplers'), self._toggle_samplers)
+        self.menu_view = menubar.addMenu('')
+        self.act_toggle_sidebar = self.menu_view.addAction('', self._toggle_sidebar)
+        self.act_toggle_samplers = self.menu_view.addAction('', self._toggle_samplers)
 
         # 帮助菜单
-        self.menu_help = menubar.addMenu(_('menu_help'))
-        self.act_about = self.menu_help.addAction(_('menu_about'), self._show_about)
+        self.menu_help = menubar.addMenu('')
+        self.act_about = self.menu_help.addAction('', self._show_about)
 
         # 语言菜单
-        self.menu_language = menubar.addMenu(_('menu_language'))
+        self.menu_language = menubar.addMenu('')
         self.act_lang_zh = self.menu_language.addAction('中文', lambda: self._switch_language('zh_CN'))
         self.act_lang_en = self.menu_language.addAction('English', lambda: self._switch_language('en_US'))
 
+        # 菜单项与翻译键的对应表：语言切换时逐项更新文字，无需重建菜单
+        # （语言名称本身不翻译，不在表中）
+        self._menu_entries = [
+            (self.menu_file.menuAction(), 'menu_file'),
+            (self.act_import, 'menu_import'),
+            (self.act_export, 'menu_export_material'),
+            (self.act_autopack, 'menu_autopack'),
+            (self.act_exit, 'menu_exit'),
+            (self.menu_edit.menuAction(), 'menu_edit'),
+            (self.act_refresh, 'menu_refresh'),
+            (self.act_clear_search, 'menu_clear_search'),
+            (self.menu_tools.menuAction(), 'menu_tools'),
+            (self.act_match, 'material_matching_button'),
+            (self.act_adv_search, 'advanced_search_button'),
+            (self.menu_view.menuAction(), 'menu_view'),
+            (self.act_toggle_sidebar, 'menu_toggle_sidebar'),
+            (self.act_toggle_samplers, 'menu_toggle_samplers'),
+            (self.menu_help.menuAction(), 'menu_help'),
+            (self.act_about, 'menu_about'),
+            (self.menu_language.menuAction(), 'menu_language'),
+        ]
+
+    def _retranslate_menubar(self):
+        """按对应表刷新菜单栏文字"""
+        for action, key in self._menu_entries:
+            self._set_text(action, _(key))
+
+    def _set_text(self, widget, text: str):
+        """设置控件/动作文字；与上次设置的文字相同时跳过"""
+        if self._widget_texts.get(widget) != text:
+            widget.setText(text)
+            self._widget_texts[widget] = text
+
     def _create_toolbar(self) -> QToolBar:
         toolbar = QToolBar()
         toolbar.setMovable(False)
@@ -418,107 +544,180 @@ class MaterialDatabaseMainWindow(QMainWindow):
         self.command_bar.search_btn.setText(_('search_button'))
         self.command_bar.clear_btn.setText(_('clear_button'))
 
-        # toolbar buttons - 添加 emoji 图标前缀
-        self.import_btn.setText(f"📥 {_('menu_import')}")
-        self.export_btn.setText(f"📤 {_('menu_export_material')}")
-        self.autopack_btn.setText(f"📦 {_('menu_autopack')}")
-        self.match_btn.setText(f"🎯 {_('material_matching_button')}")
-        self.replace_btn.setText(f"🔄 {_('material_replace_button')}")
-        self.adv_btn.setText(f"🔍 {_('advanced_search_button')}")
-        self.refresh_btn.setText(f"🔄 {_('menu_refresh')}")
-        self.more_btn.setText(f"🔧 {_('menu_tools')}")
-        self.act_manage_libraries.setText(f"📚 {_('menu_library_manager')}")
+        # toolbar buttons - 添加 emoji 图标前缀（文字未变的按钮跳过，避免重新计算工具栏布局）
+        self._set_text(self.import_btn, f"📥 {_('menu_import')}")
+        self._set_text(self.export_btn, f"📤 {_('menu_export_material')}")
+        self._set_text(self.autopack_btn, f"📦 {_('menu_autopack')}")
+        self._set_text(self.match_btn, f"🎯 {_('material_matching_button')}")
+        self._set_text(self.replace_btn, f"🔄 {_('material_replace_button')}")
+        self._set_text(self.adv_btn, f"🔍 {_('advanced_search_button')}")
+        self._set_text(self.refresh_btn, f"🔄 {_('menu_refresh')}")
+        self._set_text(self.more_btn, f"🔧 {_('menu_tools')}")
+        self._set_text(self.act_manage_libraries, f"📚 {_('menu_library_manager')}")
 
         # menubar titles & actions (菜单栏不添加 emoji)
-        self.menu_file.setTitle(_('menu_file'))
-        self.act_import.setText(_('menu_import'))
-        self.act_export.setText(_('menu_export_material'))
-        self.act_autopack.setText(_('menu_autopack'))
-        self.act_exit.setText(_('menu_exit'))
-
-        self.menu_edit.setTitle(_('menu_edit'))
-        self.act_refresh.setText(_('menu_refresh'))
-        self.act_clear_search.setText(_('menu_clear_search'))
-
-        self.menu_tools.setTitle(_('menu_tools'))
-        self.act_match.setText(_('material_matching_button'))
-        self.act_adv_search.setText(_('advanced_search_button'))
+        self._retranslate_menubar()
 
-        self.menu_view.setTitle(_('menu_view'))
-        self.act_toggle_sidebar.setText(_('menu_toggle_sidebar'))
-        self.act_toggle_samplers.setText(_('menu_toggle_samplers'))
+        if self._import_mode_dialog is not None:
+            self._retranslate_import_mode_dialog()
 
-        self.menu_help.setTitle(_('menu_help'))
-        self.act_about.setText(_('menu_about'))
-
-        self.menu_language.setTitle(_('menu_language'))
-        self.act_lang_zh.setText('中文')
-        self.act_lang_en.setText('English')
-
-        # status
-        if self.statusBar():
+        # status（正在显示的其他状态消息保持不变）
+        if self.statusBar() and self.statusBar().currentMessage() in _READY_TOKENS:
             self.statusBar().showMessage(_('status_ready'))
         
         # right panel (material editor)
-        if hasattr(self, 'right_panel') and self.right_panel:
-            self.right_panel.refresh_translations()
+        right_panel = getattr(self, 'right_panel', None)
+        if right_panel:
+            right_panel.refresh_translations()
 
     def _switch_language(self, language_code: str):
+        if language_code == language_manager.get_current_language():
+            return
         language_manager.set_language(language_code)
         self._apply_translations()
 
     # ===== data loading & handlers =====
     def _load_libraries(self):
+        # 库列表刷新意味着导入/删除等写操作刚刚完成
+        self._invalidate_material_queries()
         libs = self.db.get_libraries()
-        self.library_model.load(libs)
-        self.command_bar.library_combo.blockSignals(True)
-        self.command_bar.library_combo.clear()
-        for lib in libs:
-            self.command_bar.library_combo.addItem(lib.get('name', ''), lib)
-        self.command_bar.library_combo.blockSignals(False)
+        old_libs = self.library_model.libraries
+        # 库列表与上次完全相同时，列表模型和下拉框都无需同步
+        if libs != old_libs:
+            self.library_model.load(libs)
+            self._sync_library_combo(old_libs, libs)
         if libs:
             self.command_bar.library_combo.setCurrentIndex(0)
             self._set_current_library(libs[0].get('id'))
 
+    def _sync_library_combo(self, old_libs: List[Dict[str, Any]], libs: List[Dict[str, Any]]):
+        """增量同步库下拉框：只替换发生变化的条目（与 Python 侧的旧列表比较，不逐项读回 itemData）"""
+        combo = self.command_bar.library_combo
+        change = diff_row_range(old_libs, libs)
+        if change is None:
+            return
+        start, old_end, new_end = change
+        combo.blockSignals(True)
+        for row in range(old_end - 1, start - 1, -1):
+            combo.removeItem(row)
+        for row in range(start, new_end):
+            combo.insertItem(row, libs[row].get('name', ''), libs[row])
+        combo.blockSignals(False)
+
     def _set_current_library(self, library_id: Optional[int]):
         self.current_library_id = library_id
         self._load_materials(keyword=self.command_bar.search_edit.text().strip())
 
-    def _load_materials(self, keyword: str = ""):
-        """同步加载材质列表（带等待光标和状态栏提示）"""
+    def _load_materials(self, keyword: str = "", refine: bool = False, force: bool = False):
+        """同步加载材质列表（带等待光标和状态栏提示）
+
+        refine=True 时若关键字是在上次关键字基础上追加输入，直接筛选上次结果，不再查询数据库；
+        force=True 时即使请求与当前显示内容相同也重新加载
+        """
         if self.current_library_id is None:
             self.material_model.load([])
+            self._rendered_token = None
+            return
+
+        token = (self.current_library_id, keyword)
+        if not force and token == self._rendered_token:
             return
+
+        # 列表面板被隐藏时不刷新，等面板重新显示时再加载
+        if self.left_panel.isHidden():
+            self._pending_material_load = (keyword, refine)
+            return
+        self._pending_material_load = None
         
         # 显示等待光标和状态栏提示
-        from PySide6.QtGui import QCursor
         QApplication.setOverrideCursor(QCursor(Qt.WaitCursor))
         self.statusBar().showMessage(_('loading_materials'))
         QApplication.processEvents()
         
         try:
-            # 同步加载 - QAbstractListModel 已优化为毫秒级
-            materials = self.db.search_materials(
-                library_id=self.current_library_id,
-                keyword=keyword
-            )
-            self.material_model.load(materials)
-            
-            if materials:
-                # auto-select first
-                index = self.material_model.index(0, 0)
-                self.left_panel.list_view.setCurrentIndex(index)
-                mid = self.material_model.get_material_id(index)
-                if mid:
-                    self._load_material_detail(mid)
+            refined = self._refine_cached_search(keyword) if refine else None
+            if refined is not None:
+                materials, blobs = refined
+            else:
+                materials, blobs = self._query_materials(keyword)
+            self._search_cache = (self.current_library_id, keyword, materials, blobs)
+            self._render_materials(materials)
+            self._rendered_token = token
             
-            self.statusBar().showMessage(_('materials_loaded').format(count=len(materials)), 2000)
+            self._set_status(_fmt('materials_loaded', count=len(materials)), 2000)
         except Exception as e:
-            self.statusBar().showMessage(_('load_failed_msg').format(error=e), 3000)
+            self._set_status(_fmt('load_failed_msg', error=e), 3000)
         finally:
             # 恢复正常光标
             QApplication.restoreOverrideCursor()
 
+    def _render_materials(self, materials: List[Dict[str, Any]]):
+        """显示材质列表并自动选中第一项（关键字搜索与高级搜索共用）"""
+        self.material_model.load(materials)
+        if materials:
+            # auto-select first
+            index = self.material_model.index(0, 0)
+            self.left_panel.list_view.setCurrentIndex(index)
+            mid = self.material_model.get_material_id(index)
+            if mid:
+                self._load_material_detail(mid)
+
+    def _query_materials(self, keyword: str):
+        """查询当前库的材质（优先使用 LRU 缓存），返回 (结果, 搜索文本)"""
+        key = (self.current_library_id, keyword)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            return cached
+        # 同步加载 - QAbstractListModel 已优化为毫秒级
+        materials = self.db.search_materials(
+            library_id=self.current_library_id,
+            keyword=keyword
+        )
+        result = (materials, [material_search_blob(m) for m in materials])
+        self._query_cache[key] = result
+        while len(self._query_cache) > MATERIAL_QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return result
+
+    def _invalidate_material_queries(self):
+        """数据库内容变化后清空查询结果缓存"""
+        self._query_cache.clear()
+        self._fetch_material.cache_clear()
+        self._search_cache = None
+        self._rendered_token = None
+
+    def _refine_source(self, keyword: str):
+        """
+        查找可在内存中筛选出新关键字结果的已有结果，返回 (材质列表, 搜索文本)；没有时返回 None
+
+        优先使用上次结果（新关键字包含上次关键字时，新结果必为其子集）；
+        否则使用缓存中整个库的材质（空关键字的查询结果），任何关键字都可在其中筛选，无需查询数据库
+        """
+        if not keyword:
+            return None
+        if self._search_cache is not None:
+            library_id, prev_keyword, prev_materials, prev_blobs = self._search_cache
+            if (library_id == self.current_library_id
+                    and search_keyword_term(prev_keyword) in search_keyword_term(keyword)):
+                return prev_materials, prev_blobs
+        full_key = (self.current_library_id, "")
+        full = self._query_cache.get(full_key)
+        if full is not None:
+            self._query_cache.move_to_end(full_key)
+        return full
+
+    def _can_refine(self, keyword: str) -> bool:
+        """新关键字的结果能否在内存中筛选得到"""
+        return self._refine_source(keyword) is not None
+
+    def _refine_cached_search(self, keyword: str):
+        """在已有结果中筛选新关键字；无法复用时返回 None"""
+        source = self._refine_source(keyword)
+        if source is None:
+            return None
+        return filter_materials_by_term(source[0], source[1], search_keyword_term(keyword))
+
     def _on_library_changed(self, idx: int):
         data = self.command_bar.library_combo.itemData(idx)
         if isinstance(data, dict):
@@ -526,12 +725,22 @@ class MaterialDatabaseMainWindow(QMainWindow):
 
     def _on_search(self):
         # 使用防抖：重置定时器，等待用户停止输入后再执行搜索
+        keyword = self.command_bar.search_edit.text().strip()
+        in_memory = (self._can_refine(keyword)
+                     or (self.current_library_id, keyword) in self._query_cache)
+        self._search_timer.setInterval(SEARCH_REFINE_DEBOUNCE_MS if in_memory else SEARCH_QUERY_DEBOUNCE_MS)
         self._search_timer.start()
     
-    def _do_search(self):
-        """实际执行搜索（由防抖定时器触发）"""
+    def _on_search_timeout(self):
+        """防抖定时器触发：输入过程中的搜索可复用上次结果"""
+        self._do_search(refine=True)
+
+    def _do_search(self, refine: bool = False, force: bool = False):
+        """实际执行搜索（点击搜索按钮或回车时 force=True，即使关键字未变也重新加载）"""
+        # 立即搜索时取消尚未触发的防抖搜索，避免同一关键字再查询一次
+        self._search_timer.stop()
         keyword = self.command_bar.search_edit.text().strip()
-        self._load_materials(keyword=keyword)
+        self._load_materials(keyword=keyword, refine=refine, force=force)
         # 重置滚动状态防止跳动
         if hasattr(self.left_panel.list_view, 'reset_scroll_state'):
             self.left_panel.list_view.reset_scroll_state()
@@ -558,6 +767,10 @@ class MaterialDatabaseMainWindow(QMainWindow):
                 if self.command_bar.search_edit.text():
                     self._on_clear_search()
                     return True
+        elif obj is getattr(self, 'left_panel', None):
+            if event.type() == QEvent.Show and self._pending_material_load is not None:
+                keyword, refine = self._pending_material_load
+                self._load_materials(keyword=keyword, refine=refine)
         return super().eventFilter(obj, event)
 
     def _on_material_selected(self, material_data):
@@ -569,7 +782,6 @@ class MaterialDatabaseMainWindow(QMainWindow):
             # 使用防抖：避免快速点击时重复加载
             self._pending_material_id = mid
             if not hasattr(self, '_material_timer'):
-                from PySide6.QtCore import QTimer
                 self._material_timer = QTimer()
                 self._material_timer.setSingleShot(True)
                 self._material_timer.setInterval(50)  # 50ms 防抖
@@ -582,32 +794,21 @@ class MaterialDatabaseMainWindow(QMainWindow):
         if mid:
             self._load_material_detail(mid)
 
+    def _fetch_material_detail(self, material_id: int) -> Optional[Dict[str, Any]]:
+        """查询材质详情（经 self._fetch_material 的 LRU 缓存调用，缓存内容不可修改）"""
+        return _intern_material(self.db.get_material_detail(material_id))
+
     def _load_material_detail(self, material_id: int):
-        import copy
-        # 使用缓存避免重复查询数据库
-        if not hasattr(self, '_material_cache'):
-            self._material_cache = {}  # 简单的LRU缓存
-            self._cache_order = []
-            self._max_cache_size = 20  # 缓存最多20个材质
-        
-        if material_id in self._material_cache:
-            # 深拷贝缓存数据，防止右侧面板修改影响缓存
-            detail = copy.deepcopy(self._material_cache[material_id])
-            # 移到缓存末尾（最近使用）
-            self._cache_order.remove(material_id)
-            self._cache_order.append(material_id)
-        else:
-            detail = self.db.get_material_detail(material_id)
-            # 存储深拷贝到缓存，保持原始数据完整
-            self._material_cache[material_id] = copy.deepcopy(detail)
-            self._cache_order.append(material_id)
-            # 超出缓存大小时移除最旧的
-            while len(self._cache_order) > self._max_cache_size:
-                old_id = self._cache_order.pop(0)
-                self._material_cache.pop(old_id, None)
-        
-        self.current_material = detail
-        self.right_panel.load_detail(detail)
+        # 使用缓存避免重复查询数据库；深拷贝缓存数据，防止右侧面板修改影响缓存
+        self.current_material_id = material_id
+        self.right_panel.load_detail(copy.deepcopy(self._fetch_material(material_id)))
+
+    @property
+    def current_material(self) -> Optional[Dict[str, Any]]:
+        """当前选中材质的详情（只读：取自 LRU 缓存，需要修改时请先复制）"""
+        if self.current_material_id is None:
+            return None
+        return self._fetch_material(self.current_material_id)
 
     def select_material_by_id(self, material_id: int, library_id: Optional[int] = None):
         """在列表中选中指定的材质ID（如果需要则切换库）"""
@@ -642,7 +843,7 @@ class MaterialDatabaseMainWindow(QMainWindow):
                 combo.setCurrentIndex(idx)
                 lib_switched = True
             else:
-                print(_('warning_library_not_found').format(library_id=library_id))
+                logger.warning(_('warning_library_not_found').format(library_id=library_id))
                 # 兜底：直接切换内部状态
                 self._set_current_library(library_id)
                 lib_switched = True
@@ -659,31 +860,46 @@ class MaterialDatabaseMainWindow(QMainWindow):
     
     def _select_material_in_list(self, material_id: int):
         """在当前列表中查找并选中指定材质"""
-        # 遍历模型查找匹配的材质
-        for row in range(self.material_model.rowCount()):
-            index = self.material_model.index(row, 0)
-            mid = self.material_model.get_material_id(index)
-            if mid == material_id:
-                # 找到了，选中并滚动到可见
-                self.left_panel.list_view.setCurrentIndex(index)
-                self.left_panel.list_view.scrollTo(index)
-                self._load_material_detail(material_id)
-                return True
-        return False
+        row = self.material_model.row_of(material_id)
+        if row is None:
+            return False
+        # 找到了，选中并滚动到可见
+        self.material_model.ensure_row_loaded(row)
+        index = self.material_model.index(row, 0)
+        self.left_panel.list_view.setCurrentIndex(index)
+        self.left_panel.list_view.scrollTo(index)
+        self._load_material_detail(material_id)
+        return True
 
     # ===== toolbar handlers (placeholders) =====
     def _info(self, text: str):
-        self.statusBar().showMessage(text, 3000)
+        self._set_status(text, 3000)
+
+    def _set_status(self, text: str, timeout: int = 0):
+        """合并同一次操作中的多次状态栏更新：只记录最新文本，回到事件循环时统一显示一次"""
+        self._pending_status = (text, timeout)
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            QTimer.singleShot(0, self._flush_status)
+
+    def _flush_status(self):
+        self._status_scheduled = False
+        if self._pending_status is not None:
+            text, timeout = self._pending_status
+            self._pending_status = None
+            self.statusBar().showMessage(text, timeout)
 
     def _on_import_library(self):
         """导入/新建材质库 (对应原add_library)"""
         try:
             # 旧 Tk 版：先弹 ImportModeDialog(文件夹/DCX/XML)
-            from PySide6.QtWidgets import QInputDialog
-
-            items = [_('import_mode_folder_xml'), _('import_mode_dcx_auto'), _('import_mode_single_xml')]
-            choice, ok = QInputDialog.getItem(self, _('import_mode_dialog_title'), _('import_mode_label'), items, 0, False)
-            if not ok or not choice:
+            dlg = self._get_import_mode_dialog()
+            items = dlg.comboBoxItems()
+            dlg.setTextValue(items[0])
+            if not dlg.exec():
+                return
+            choice = dlg.textValue()
+            if not choice:
                 return
 
             if choice == items[0]:
@@ -697,15 +913,27 @@ class MaterialDatabaseMainWindow(QMainWindow):
             import traceback
             QMessageBox.warning(self, _('import_failed'), _('import_failed_msg').format(exc=exc, traceback=traceback.format_exc()))
 
+    def _get_import_mode_dialog(self):
+        """获取导入方式选择对话框（首次使用时创建，之后复用）"""
+        if self._import_mode_dialog is None:
+            self._import_mode_dialog = QInputDialog(self)
+            self._import_mode_dialog.setComboBoxEditable(False)
+            self._retranslate_import_mode_dialog()
+        return self._import_mode_dialog
+
+    def _retranslate_import_mode_dialog(self):
+        dlg = self._import_mode_dialog
+        dlg.setWindowTitle(_('import_mode_dialog_title'))
+        dlg.setLabelText(_('import_mode_label'))
+        dlg.setComboBoxItems([_('import_mode_folder_xml'), _('import_mode_dcx_auto'), _('import_mode_single_xml')])
+
     def _import_library_from_folder(self):
         """从文件夹导入（支持 XML 和 matbin，使用统一的导入对话框）"""
-        from PySide6.QtWidgets import QFileDialog
         folder = QFileDialog.getExistingDirectory(self, _('select_library_folder'))
         if not folder:
             return
 
         try:
-            import os
             from .dcx_import_dialog_qt import DCXImportDialogQt
 
             default_name = os.path.basename(folder.rstrip("/\\"))
@@ -736,19 +964,34 @@ class MaterialDatabaseMainWindow(QMainWindow):
 
     def _import_single_xml(self):
         """导入单个XML (新逻辑：选择库、查重、路径修正)"""
-        from PySide6.QtWidgets import QFileDialog, QInputDialog
         file_path, _unused = QFileDialog.getOpenFileName(self, _('select_xml_file'), filter="XML Files (*.xml);;All Files (*.*)")
         if not file_path:
             return
-            
+
+        # 1. 在后台线程解析 XML (优先解析以获取信息供预览)，大文件解析期间界面保持响应
+        QApplication.setOverrideCursor(QCursor(Qt.WaitCursor))
+        self.statusBar().showMessage(_('parsing_materials'))
+        parser = self._get_xml_parser()
+
+        def _worker():
+            try:
+                material_data, error = parser.parse_file(file_path), None
+            except Exception as exc:
+                material_data, error = None, exc
+            self._ui_call(lambda: self._on_single_xml_parsed(file_path, material_data, error))
+
+        threading.Thread(target=_worker, daemon=True).start()
+
+    def _on_single_xml_parsed(self, file_path: str, material_data: Optional[Dict[str, Any]], error: Optional[Exception]):
+        """单个 XML 解析完成后（主线程）：预览、查重并写入数据库"""
+        QApplication.restoreOverrideCursor()
+        self.statusBar().clearMessage()
         try:
-            import os
-            from src.core.xml_parser import MaterialXMLParser
+            if error is not None:
+                raise error
+
             from .import_dialogs_qt import ImportSingleXmlDialog
-            
-            # 1. 解析 XML (优先解析以获取信息供预览)
-            parser = MaterialXMLParser()
-            material_data = parser.parse_file(file_path)
+
             if not material_data:
                 QMessageBox.warning(self, _('import_failed'), _('xml_parse_failed'))
                 return
@@ -757,7 +1000,11 @@ class MaterialDatabaseMainWindow(QMainWindow):
             material_data['is_single_import'] = 1
 
             # 2. 弹出导入预览对话框 (允许修改信息)
-            dlg = ImportSingleXmlDialog(self, self.db, material_data, current_lib_id=self.current_library_id)
+            dlg = ImportSingleXmlDialog(
+                self, self.db, material_data,
+                current_lib_id=self.current_library_id,
+                libraries=self.library_model.libraries,
+            )
             if dlg.exec() != QDialog.Accepted:
                 return
                 
@@ -798,8 +1045,8 @@ class MaterialDatabaseMainWindow(QMainWindow):
                 # 假设 file_path 是 "parts/bd/old_name.matbin"
                 old_path = material_data.get('file_path', '')
                 if old_path:
-                    dir_part = os.path.dirname(old_path)
-                    ext_part = os.path.splitext(old_path)[1]
+                    dir_part, old_name = os.path.split(old_path)
+                    ext_part = os.path.splitext(old_name)[1]
                     # 如果原路径没有后缀，ext_part 为空
                     new_path = os.path.join(dir_part, current_filename + ext_part).replace("\\", "/")
                     material_data['file_path'] = new_path
@@ -836,8 +1083,7 @@ class MaterialDatabaseMainWindow(QMainWindow):
         except Exception as exc:
             import traceback
             # 使用 logging 记录详细堆栈，而不是弹窗显示全部，避免吓到用户
-            import logging
-            logging.error(f"Import post-process failed: {exc}", exc_info=True)
+            logger.error(f"Import post-process failed: {exc}", exc_info=True)
             QMessageBox.warning(self, _('import_failed'), _('import_xml_failed').format(exc=exc, traceback=traceback.format_exc()))
 
     def _import_library_from_dcx(self):
@@ -873,8 +1119,6 @@ class MaterialDatabaseMainWindow(QMainWindow):
         
         # 直接调用导出逻辑,不通过信号
         try:
-            from PySide6.QtWidgets import QFileDialog
-            
             # 询问保存位置
             file_path, _unused = QFileDialog.getSaveFileName(
                 self, 
@@ -886,11 +1130,9 @@ class MaterialDatabaseMainWindow(QMainWindow):
                 return
             
             # 导出逻辑
-            from src.core.xml_parser import MaterialXMLParser
-            parser = MaterialXMLParser()
+            parser = self._get_xml_parser()
             
             # 使用深拷贝避免修改原始数据
-            import copy
             export_data = copy.deepcopy(self.current_material)
             export_data['add_to_autopack'] = self.right_panel.autopack_check.isChecked()
             
@@ -898,12 +1140,11 @@ class MaterialDatabaseMainWindow(QMainWindow):
             
             # 如果勾选了自动封包
             if export_data.get('add_to_autopack', False):
-                from src.core.autopack_manager import AutoPackManager
-                autopack_mgr = AutoPackManager()
+                autopack_mgr = self._get_autopack_manager()
                 autopack_mgr.add_to_autopack(file_path)
-                self._info(_('export_autopack_success').format(file_path=file_path))
+                self._info(_fmt('export_autopack_success', file_path=file_path))
             else:
-                self._info(_('export_success').format(file_path=file_path))
+                self._info(_fmt('export_success', file_path=file_path))
                 
         except Exception as exc:
             import traceback
@@ -912,10 +1153,9 @@ class MaterialDatabaseMainWindow(QMainWindow):
     def _on_autopack(self):
         """打开自动封包管理器"""
         try:
-            from src.core.autopack_manager import AutoPackManager
             from .autopack_dialog_qt import AutoPackDialogQt
 
-            dlg = AutoPackDialogQt(self, AutoPackManager())
+            dlg = AutoPackDialogQt(self, self._get_autopack_manager())
             dlg.exec()
         except Exception as exc:
             import traceback
@@ -973,13 +1213,13 @@ class MaterialDatabaseMainWindow(QMainWindow):
                 """执行搜索并返回结果数量"""
                 results = self.db.advanced_search_materials(criteria)
                 
-                # 更新材质列表显示
-                self.material_model.clear()
-                for mat in results:
-                    self.material_model.add_material(mat)
+                # 更新材质列表显示；结果不对应关键字搜索，不能作为后续筛选/跳过刷新的依据
+                self._search_cache = None
+                self._rendered_token = None
+                self._render_materials(results)
                 
                 # 更新状态栏
-                self._info(_('advanced_search_result_msg').format(count=len(results)))
+                self._info(_fmt('advanced_search_result_msg', count=len(results)))
                 
                 return len(results)
             
@@ -1035,22 +1275,21 @@ class MaterialDatabaseMainWindow(QMainWindow):
             return
         try:
             self.db.update_material(mid, updated_data)
+            self._invalidate_material_queries()
             
             # 检查是否需要添加到自动封包
             if self.right_panel.autopack_check.isChecked():
-                from src.core.autopack_manager import AutoPackManager
-                
                 # 添加材质ID引用到自动封包列表
                 material_name = self.current_material.get('filename', '')
-                autopack_mgr = AutoPackManager()
+                autopack_mgr = self._get_autopack_manager()
                 autopack_mgr.add_material_by_db_id(mid, material_name)
-                self.statusBar().showMessage(_('save_and_autopack_success'), 3000)
+                self._set_status(_('save_and_autopack_success'), 3000)
                 try:
                     toast(self, _('save_and_autopack_success'))
                 except Exception:
                     pass
             else:
-                self.statusBar().showMessage(_('save_success'), 3000)
+                self._set_status(_('save_success'), 3000)
                 try:
                     toast(self, _('save_success'))
                 except Exception:
@@ -1059,9 +1298,9 @@ class MaterialDatabaseMainWindow(QMainWindow):
             # 重新加载详情，确保显示与数据库一致
             self._load_material_detail(mid)
         except Exception as exc:
-            self.statusBar().showMessage(_('save_failed_msg').format(exc=exc), 5000)
+            self._set_status(_fmt('save_failed_msg', exc=exc), 5000)
             try:
-                toast(self, _('save_failed_msg').format(exc=exc), duration_ms=4200)
+                toast(self, _fmt('save_failed_msg', exc=exc), duration_ms=4200)
             except Exception:
                 pass
     
@@ -1069,7 +1308,6 @@ class MaterialDatabaseMainWindow(QMainWindow):
         """从右侧面板触发的导出 (exportRequested信号)"""
         try:
             # 调用原有导出逻辑
-            from PySide6.QtWidgets import QFileDialog
             # 询问保存位置
             file_path, _unused = QFileDialog.getSaveFileName(
                 self, 
@@ -1081,8 +1319,7 @@ class MaterialDatabaseMainWindow(QMainWindow):
                 return
             
             # 导出逻辑(需要使用原xml_parser)
-            from src.core.xml_parser import MaterialXMLParser
-            parser = MaterialXMLParser()
+            parser = self._get_xml_parser()
             parser.export_material_to_xml(export_data, file_path)
             
             # 如果勾选了自动封包
@@ -1094,9 +1331,9 @@ class MaterialDatabaseMainWindow(QMainWindow):
                 except Exception:
                     pass
             else:
-                self._info(_('export_success').format(file_path=file_path))
+                self._info(_fmt('export_success', file_path=file_path))
                 try:
-                    toast(self, _('export_success').format(file_path=file_path))
+                    toast(self, _fmt('export_success', file_path=file_path))
                 except Exception:
                     pass
                 
@@ -1133,7 +1370,7 @@ class MaterialDatabaseMainWindow(QMainWindow):
             if left_panel:
                 left_panel.setVisible(not left_panel.isVisible())
                 status = _('sidebar_shown') if left_panel.isVisible() else _('sidebar_hidden')
-                self.statusBar().showMessage(status, 2000)
+                self._set_status(status, 2000)
     
     def _toggle_samplers(self):
         """切换采样器显示/隐藏"""
@@ -1143,6 +1380,8 @@ class MaterialDatabaseMainWindow(QMainWindow):
     
     def _show_about(self):
         """显示关于对话框"""
+        from .about_dialog_qt import AboutDialog
+
         dialog = AboutDialog(self)
         dialog.exec()
 
@@ -3,34 +3,55 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QFrame,
     QHBoxLayout, QPushButton, QLineEdit, QMessageBox,
     QGroupBox, QCheckBox, QGridLayout, QComboBox,
-    QSpinBox, QDoubleSpinBox, QSizePolicy, QGraphicsDropShadowEffect
+    QSizePolicy, QGraphicsDropShadowEffect
 )
-from PySide6.QtCore import Qt, Signal, QRect, QSize, QEvent
+from PySide6.QtCore import Qt, Signal, QRect, QSize, QEvent, QTimer
 from PySide6.QtWidgets import QLayout, QWidgetItem
 from PySide6.QtGui import QCursor, QIcon
 import json
+import logging
+from functools import lru_cache
 
 from src.core.i18n import _
 from src.utils.resource_path import get_assets_path
 from .sampler_panel import SamplerPanel
 from .models import SamplerTableModel
 from .smooth_scroll import SmoothScrollArea
+from .widgets.focus_wheel import FocusWheelSpinBox, FocusWheelDoubleSpinBox
 from .color_picker_dialog import ColorPreviewWidget, GradientPreviewWidget, ColorPickerDialog, GradientEditorDialog
 
-
-class FocusWheelSpinBox(QSpinBox):
-    def wheelEvent(self, event):
-        if self.hasFocus():
-            super().wheelEvent(event)
-        else:
-            event.ignore()
-
-class FocusWheelDoubleSpinBox(QDoubleSpinBox):
-    def wheelEvent(self, event):
-        if self.hasFocus():
-            super().wheelEvent(event)
-        else:
-            event.ignore()
+logger = logging.getLogger(__name__)
+
+# 局部 UI 设计 token（只读，所有面板共用一份）
+_UI_TOKENS = {
+    "card_radius": 18,
+    "inner_radius": 14,
+    "control_radius": 12,
+    "card_bg_1": "rgba(22, 30, 46, 235)",
+    "card_bg_2": "rgba(12, 16, 28, 235)",
+    "card_border": "rgba(255,255,255,14)",
+    # hover 边框更亮一点，作为“重点色提示”
+    "card_border_hover": "rgba(47, 129, 247, 120)",
+    "shadow": "rgba(0,0,0,160)",
+    # Accent / emphasis
+    # 亮蓝方案（与全局 palette 对齐）
+    "accent": "#2F81F7",
+    "accent_soft": "rgba(47, 129, 247, 38)",
+    "accent_border": "rgba(47, 129, 247, 170)",
+
+    # Typography colors
+    "title": "#F5F8FF",
+    "muted": "rgba(190,200,220,175)",
+    "label": "rgba(221,230,255,235)",
+    "value": "rgba(245,248,255,235)",
+    "key": "rgba(165,175,205,155)",
+    "control_bg": "rgba(10, 14, 24, 160)",
+    # 控件边框：统一为“淡蓝细边框”（和顶部搜索栏一致的观感）
+    "control_border": "rgba(110, 165, 255, 90)",
+    "control_border_hover": "rgba(140, 190, 255, 130)",
+    "focus": "rgba(47, 129, 247, 210)",
+    "focus_fill": "rgba(47, 129, 247, 24)",
+}
 
 
 class MaterialEditorPanel(QWidget):
@@ -38,6 +59,22 @@ class MaterialEditorPanel(QWidget):
     saveRequested = Signal(dict)
     exportRequested = Signal(dict)
 
+    # 语言切换时刷新的可选标签：(属性名, 翻译键)
+    _TRANSLATED_LABELS = (
+        ('basic_info_title', 'basic_info'),
+        ('editable_params_title', 'editable_params'),
+        ('editor_hint_label', 'editor_hint'),
+        ('empty_label', 'select_material_detail_hint'),
+    )
+    # 基本信息字段 -> 翻译键
+    _FIELD_LABEL_KEYS = (
+        ('filename', 'filename'),
+        ('shader_path', 'shader_path'),
+        ('source_path', 'file_path'),
+        ('compression', 'compression_type'),
+        ('key_value', 'key_value'),
+    )
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self._current_detail: Optional[Dict[str, Any]] = None
@@ -53,6 +90,11 @@ class MaterialEditorPanel(QWidget):
         self._use_grouping = True
         self._selected_group = _('all_params')
         self._search_text = ""
+        # 参数搜索防抖：停止输入后再重建参数卡片，连续输入只重建一次
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(self._apply_search)
         self._params_cols = 3
         self._build_ui()
 
@@ -206,35 +248,7 @@ class MaterialEditorPanel(QWidget):
 
     def _ui_tokens(self) -> dict:
         """局部 UI 设计 token，尽量贴近你给的参考图（深色卡片 + 细描边 + 柔阴影 + 嵌入式控件）。"""
-        return {
-            "card_radius": 18,
-            "inner_radius": 14,
-            "control_radius": 12,
-            "card_bg_1": "rgba(22, 30, 46, 235)",
-            "card_bg_2": "rgba(12, 16, 28, 235)",
-            "card_border": "rgba(255,255,255,14)",
-            # hover 边框更亮一点，作为“重点色提示”
-            "card_border_hover": "rgba(47, 129, 247, 120)",
-            "shadow": "rgba(0,0,0,160)",
-            # Accent / emphasis
-            # 亮蓝方案（与全局 palette 对齐）
-            "accent": "#2F81F7",
-            "accent_soft": "rgba(47, 129, 247, 38)",
-            "accent_border": "rgba(47, 129, 247, 170)",
-
-            # Typography colors
-            "title": "#F5F8FF",
-            "muted": "rgba(190,200,220,175)",
-            "label": "rgba(221,230,255,235)",
-            "value": "rgba(245,248,255,235)",
-            "key": "rgba(165,175,205,155)",
-            "control_bg": "rgba(10, 14, 24, 160)",
-            # 控件边框：统一为“淡蓝细边框”（和顶部搜索栏一致的观感）
-            "control_border": "rgba(110, 165, 255, 90)",
-            "control_border_hover": "rgba(140, 190, 255, 130)",
-            "focus": "rgba(47, 129, 247, 210)",
-            "focus_fill": "rgba(47, 129, 247, 24)",
-        }
+        return _UI_TOKENS
 
     def _card_shadow(self, widget: QWidget, blur: int = 34, y: int = 14):
         t = self._ui_tokens()
@@ -327,8 +341,10 @@ class MaterialEditorPanel(QWidget):
             "}"
         )
 
-    def _control_qss(self) -> str:
-        t = self._ui_tokens()
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _control_qss() -> str:
+        t = _UI_TOKENS
         r = t["control_radius"]
         return (
             # 更顺滑的“玻璃质感”背景（轻微渐变 + 顶部高光），降低边框噪点感
@@ -342,8 +358,10 @@ class MaterialEditorPanel(QWidget):
             f"color: {t['value']};"
         )
 
-    def _control_state_qss(self) -> str:
-        t = self._ui_tokens()
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _control_state_qss() -> str:
+        t = _UI_TOKENS
         return (
             # hover：边框更亮一些 + 背景略提亮
             f":hover {{ border-color: {t['control_border_hover']}; background: rgba(47, 129, 247, 14); }}"
@@ -351,6 +369,34 @@ class MaterialEditorPanel(QWidget):
             f":focus {{ border-color: {t['focus']}; background: {t['focus_fill']}; }}"
         )
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _spin_qss() -> str:
+        """参数数值输入框样式（所有数值框相同，只拼接一次）"""
+        return (
+            "QAbstractSpinBox { font-size:9pt; "
+            + MaterialEditorPanel._control_qss()
+            + " padding-right: 18px; }"
+            + "QAbstractSpinBox"
+            + MaterialEditorPanel._control_state_qss()
+            # up/down 按钮：透明底 + hover 轻提示，避免出现硬分割
+            + "QAbstractSpinBox::up-button, QAbstractSpinBox::down-button {"
+            + "subcontrol-origin: border;"
+            + "width: 18px;"
+            + "border: none;"
+            + "background: transparent;"
+            + "}"
+            + "QAbstractSpinBox::up-button { subcontrol-position: top right; }"
+            + "QAbstractSpinBox::down-button { subcontrol-position: bottom right; }"
+            + "QAbstractSpinBox::up-button:hover, QAbstractSpinBox::down-button:hover {"
+            + "background: rgba(255,255,255,6);"
+            + "}"
+            + "QAbstractSpinBox::up-button:pressed, QAbstractSpinBox::down-button:pressed {"
+            + "background: rgba(47,129,247,18);"
+            + "}"
+            + "QAbstractSpinBox::up-arrow, QAbstractSpinBox::down-arrow { width: 8px; height: 8px; }"
+        )
+
     def _combobox_full_qss(self) -> str:
         """完整的深色主题 ComboBox 样式（包含下拉列表）"""
         t = self._ui_tokens()
@@ -766,7 +812,14 @@ class MaterialEditorPanel(QWidget):
         self._rebuild_params_view()
 
     def _on_search_changed(self, text: str):
-        self._search_text = (text or "").strip().lower()
+        """搜索文本变化（启动防抖定时器）"""
+        self._search_timer.start()
+
+    def _apply_search(self):
+        search_text = self.search_edit.text().strip().lower()
+        if search_text == self._search_text:
+            return
+        self._search_text = search_text
         self._rebuild_params_view()
 
     def _set_all_groups_collapsed(self, collapsed: bool):
@@ -1091,29 +1144,7 @@ class MaterialEditorPanel(QWidget):
                     spin.setDecimals(6)
                     spin.setValue(float(val) if val else 0.0)
                 
-                spin.setStyleSheet(
-                    "QAbstractSpinBox { font-size:9pt; "
-                    + self._control_qss()
-                    + " padding-right: 18px; }"
-                    + "QAbstractSpinBox"
-                    + self._control_state_qss()
-                    # up/down 按钮：透明底 + hover 轻提示，避免出现硬分割
-                    + "QAbstractSpinBox::up-button, QAbstractSpinBox::down-button {"
-                    + "subcontrol-origin: border;"
-                    + "width: 18px;"
-                    + "border: none;"
-                    + "background: transparent;"
-                    + "}"
-                    + "QAbstractSpinBox::up-button { subcontrol-position: top right; }"
-                    + "QAbstractSpinBox::down-button { subcontrol-position: bottom right; }"
-                    + "QAbstractSpinBox::up-button:hover, QAbstractSpinBox::down-button:hover {"
-                    + "background: rgba(255,255,255,6);"
-                    + "}"
-                    + "QAbstractSpinBox::up-button:pressed, QAbstractSpinBox::down-button:pressed {"
-                    + "background: rgba(47,129,247,18);"
-                    + "}"
-                    + "QAbstractSpinBox::up-arrow, QAbstractSpinBox::down-arrow { width: 8px; height: 8px; }"
-                )
+                spin.setStyleSheet(self._spin_qss())
                 spin.setMinimumHeight(22)
                 spin.setMinimumWidth(80)
                 spin.setMaximumWidth(120)
@@ -1145,28 +1176,7 @@ class MaterialEditorPanel(QWidget):
                 spin.setDecimals(6)
                 spin.setValue(float(value) if value else 0.0)
             
-            spin.setStyleSheet(
-                "QAbstractSpinBox { font-size:9pt; "
-                + self._control_qss()
-                + " padding-right: 18px; }"
-                + "QAbstractSpinBox"
-                + self._control_state_qss()
-                + "QAbstractSpinBox::up-button, QAbstractSpinBox::down-button {"
-                + "subcontrol-origin: border;"
-                + "width: 18px;"
-                + "border: none;"
-                + "background: transparent;"
-                + "}"
-                + "QAbstractSpinBox::up-button { subcontrol-position: top right; }"
-                + "QAbstractSpinBox::down-button { subcontrol-position: bottom right; }"
-                + "QAbstractSpinBox::up-button:hover, QAbstractSpinBox::down-button:hover {"
-                + "background: rgba(255,255,255,6);"
-                + "}"
-                + "QAbstractSpinBox::up-button:pressed, QAbstractSpinBox::down-button:pressed {"
-                + "background: rgba(47,129,247,18);"
-                + "}"
-                + "QAbstractSpinBox::up-arrow, QAbstractSpinBox::down-arrow { width: 8px; height: 8px; }"
-            )
+            spin.setStyleSheet(self._spin_qss())
             spin.setMinimumHeight(22)
             spin.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
             layout.addWidget(spin, 1)
@@ -1489,9 +1499,10 @@ class MaterialEditorPanel(QWidget):
         return wrapper
 
     def _collect_params(self) -> List[Dict[str, Any]]:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"_collect_params called, _param_cards has {len(self._param_cards)} items, _param_list has {len(getattr(self, '_param_list', []))} items")
+        logger.debug(
+            "_collect_params called, _param_cards has %d items, _param_list has %d items",
+            len(self._param_cards), len(getattr(self, '_param_list', [])),
+        )
         
         # 使用原始参数列表作为基础，避免丢失未显示的参数
         original_params = getattr(self, '_param_list', [])
@@ -1529,7 +1540,7 @@ class MaterialEditorPanel(QWidget):
                     'key_value': orig_param.get('key_value', '') or orig_param.get('key', '')
                 })
         
-        logger.info(f"_collect_params returning {len(result)} params")
+        logger.debug("_collect_params returning %d params", len(result))
         return result
     
     def _extract_param_from_card(self, card_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -1589,26 +1600,18 @@ class MaterialEditorPanel(QWidget):
         self.save_btn.setText(_('save'))
 
         
-        # 区域卡片标题
-        if hasattr(self, 'basic_info_title') and self.basic_info_title:
-            self.basic_info_title.setText(_('basic_info'))
-        if hasattr(self, 'editable_params_title') and self.editable_params_title:
-            self.editable_params_title.setText(_('editable_params'))
-        if hasattr(self, 'editor_hint_label') and self.editor_hint_label:
-            self.editor_hint_label.setText(_('editor_hint'))
+        # 区域卡片标题、编辑提示和空白提示
+        for attr, key in self._TRANSLATED_LABELS:
+            label = getattr(self, attr, None)
+            if label:
+                label.setText(_(key))
         
         # 基本信息字段标签
-        field_key_map = {
-            'filename': 'filename',
-            'shader_path': 'shader_path',
-            'source_path': 'file_path',
-            'compression': 'compression_type',
-            'key_value': 'key_value'
-        }
-        if hasattr(self, 'field_label_widgets'):
-            for field, i18n_key in field_key_map.items():
-                if field in self.field_label_widgets:
-                    self.field_label_widgets[field].setText(_( i18n_key))
+        field_labels = getattr(self, 'field_label_widgets', None) or {}
+        for field, i18n_key in self._FIELD_LABEL_KEYS:
+            label = field_labels.get(field)
+            if label is not None:
+                label.setText(_(i18n_key))
         
         # 可编辑参数区域的工具栏
         self.display_btn.setText(_('content'))
@@ -1627,12 +1630,9 @@ class MaterialEditorPanel(QWidget):
             self.group_combo.setItemText(0, _('all_params'))
         
         # 采样器面板
-        if hasattr(self, 'sampler_panel') and self.sampler_panel:
-            self.sampler_panel.refresh_translations()
-        
-        # 空白提示
-        if hasattr(self, 'empty_label') and self.empty_label:
-            self.empty_label.setText(_('select_material_detail_hint'))
+        sampler_panel = getattr(self, 'sampler_panel', None)
+        if sampler_panel:
+            sampler_panel.refresh_translations()
 
 
 class _FlowLayout(QLayout):
@@ -6,6 +6,7 @@ from PySide6.QtCore import Signal, Qt
 
 from src.core.i18n import _
 from .smooth_scroll import SmoothListView
+from .models import MATERIAL_ID_ROLE
 
 
 class MaterialTreePanel(QWidget):
@@ -37,6 +38,11 @@ class MaterialTreePanel(QWidget):
         self.list_view.setSelectionMode(SmoothListView.SingleSelection)
         self.list_view.setAlternatingRowColors(True)
         self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)  # 隐藏水平滚动条
+        # 所有行高度相同：布局时不必逐行计算 sizeHint，只绘制可见区域
+        self.list_view.setUniformItemSizes(True)
+        # 分批布局：大列表重置后先布局首批行并立即显示，其余行在事件循环空闲时继续
+        self.list_view.setLayoutMode(SmoothListView.Batched)
+        self.list_view.setBatchSize(200)
         self.list_view.setStyleSheet("""
             QListView {
                 background: rgba(10, 14, 24, 160);
@@ -63,6 +69,11 @@ class MaterialTreePanel(QWidget):
         layout.addWidget(self.list_view, 1)
 
     def _on_item_clicked(self, index):
+        # 优先只取材质ID，不必复制整个材质字典
+        material_id = index.data(MATERIAL_ID_ROLE)
+        if material_id is not None:
+            self.materialSelected.emit(material_id)
+            return
         data = index.data(Qt.UserRole)
         if data is None:
             data = index.data(Qt.DisplayRole)
@@ -2,25 +2,77 @@
 Qt models for library list, material list, and samplers.
 These are lightweight wrappers over existing database data.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 import json
-from PySide6.QtGui import QStandardItemModel, QStandardItem
+from PySide6.QtGui import QStandardItemModel, QStandardItem, QColor
 from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
 from src.core.i18n import _
 
+# 材质列表中返回材质ID的数据角色（避免通过 UserRole 把整个材质字典转换为 QVariant）
+MATERIAL_ID_ROLE = Qt.UserRole + 1
+# 材质列表每次向视图提供的行数，滚动到底部时再通过 fetchMore 追加
+MATERIAL_FETCH_BATCH = 500
+
+# 深色主题下的高亮文字颜色
+_MODIFIED_COLOR = QColor('#FFDD55')  # 亮黄色文字 (修改过)
+_SINGLE_IMPORT_COLOR = QColor('#55FF55')  # 亮绿色文字 (单独导入)
+
+
+def _material_row(material: Dict[str, Any]) -> Tuple[Optional[str], Optional[QColor]]:
+    """加载时把材质记录整理为 (显示名, 文字颜色)；显示名为 None 时渲染时再取翻译"""
+    name = material.get('filename') or material.get('file_name') or None
+    if material.get('is_modified', 0):
+        color = _MODIFIED_COLOR
+    elif material.get('is_single_import', 0):
+        color = _SINGLE_IMPORT_COLOR
+    else:
+        color = None
+    return name, color
+
+
+def diff_row_range(old_rows: Sequence, new_rows: Sequence) -> Optional[Tuple[int, int, int]]:
+    """比较新旧行列表，返回变化区间 (start, old_end, new_end)，完全相同时返回 None。
+
+    去掉公共前缀与公共后缀后剩下的部分即为需要更新的行：
+    旧列表的 [start, old_end) 被新列表的 [start, new_end) 替换。
+    """
+    old_len, new_len = len(old_rows), len(new_rows)
+    limit = min(old_len, new_len)
+    start = 0
+    while start < limit and old_rows[start] == new_rows[start]:
+        start += 1
+    if start == old_len == new_len:
+        return None
+    old_end, new_end = old_len, new_len
+    while old_end > start and new_end > start and old_rows[old_end - 1] == new_rows[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+    return start, old_end, new_end
+
+
 class LibraryListModel(QStandardItemModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.libraries: List[Dict[str, Any]] = []
 
     def load(self, libraries: List[Dict[str, Any]]):
-        self.clear()
+        """刷新库列表：只替换发生变化的行（重命名/编辑描述时通常只有一行）"""
+        change = diff_row_range(self.libraries, libraries)
         self.libraries = libraries
-        for lib in libraries:
-            item = QStandardItem(f"{lib.get('name', '')} (ID:{lib.get('id')})")
-            item.setData(lib, Qt.UserRole)
-            item.setEditable(False)
-            self.appendRow(item)
+        if change is None:
+            return
+        start, old_end, new_end = change
+        if old_end > start:
+            self.removeRows(start, old_end - start)
+        for row in range(start, new_end):
+            self.insertRow(row, self._make_item(libraries[row]))
+
+    @staticmethod
+    def _make_item(lib: Dict[str, Any]) -> QStandardItem:
+        item = QStandardItem(f"{lib.get('name', '')} (ID:{lib.get('id')})")
+        item.setData(lib, Qt.UserRole)
+        item.setEditable(False)
+        return item
 
     def get_library_id(self, index) -> Optional[int]:
         if not index.isValid():
@@ -36,38 +88,70 @@ class MaterialListModel(QAbstractListModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.materials: List[Dict[str, Any]] = []
+        # 已提供给视图的各行 (显示名, 文字颜色)，随每批行一起整理，渲染时不再逐行查字典
+        self._rows: List[Tuple[Optional[str], Optional[QColor]]] = []
+        # 材质ID → 行号，首次按ID查找时生成
+        self._row_by_id: Optional[Dict[Any, int]] = None
+        # 已提供给视图的行数（大列表分批加载）
+        self._loaded = 0
 
     def load(self, materials: List[Dict[str, Any]]):
-        """加载材质列表（高性能：直接替换数据，无需创建Item对象）"""
+        """加载材质列表（高性能：直接替换数据，无需创建Item对象；超大列表只先提供第一批行）"""
         self.beginResetModel()
         self.materials = materials or []
+        self._row_by_id = None
+        self._loaded = min(len(self.materials), MATERIAL_FETCH_BATCH)
+        # 只整理第一批行，其余行在 fetchMore 时随批次整理
+        self._rows = [_material_row(m) for m in self.materials[:self._loaded]]
         self.endResetModel()
 
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return self._loaded < len(self.materials)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()):
+        if parent.isValid():
+            return
+        self._fetch_until(min(len(self.materials), self._loaded + MATERIAL_FETCH_BATCH))
+
+    def ensure_row_loaded(self, row: int):
+        """确保指定行已提供给视图（定位到尚未加载的材质时使用）"""
+        self._fetch_until(min(len(self.materials), row + 1))
+
+    def _fetch_until(self, end: int):
+        if end <= self._loaded:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, end - 1)
+        self._rows.extend(_material_row(m) for m in self.materials[self._loaded:end])
+        self._loaded = end
+        self.endInsertRows()
+
+    def row_of(self, material_id: Any) -> Optional[int]:
+        """按材质ID查找所在行（O(1)），不存在时返回 None"""
+        if self._row_by_id is None:
+            self._row_by_id = {m.get('id'): row for row, m in enumerate(self.materials)}
+        return self._row_by_id.get(material_id)
+
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         if parent.isValid():
             return 0
-        return len(self.materials)
+        return self._loaded
 
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
-        if not index.isValid() or index.row() >= len(self.materials):
+        if not index.isValid() or index.row() >= self._loaded:
             return None
         
-        material = self.materials[index.row()]
+        row = index.row()
         
         if role == Qt.DisplayRole:
-            return material.get('filename') or material.get('file_name') or _('unknown_material')
+            return self._rows[row][0] or _('unknown_material')
+        elif role == MATERIAL_ID_ROLE:
+            return self.materials[row].get('id')
         elif role == Qt.UserRole:
-            return material
+            return self.materials[row]
         elif role == Qt.ForegroundRole:
-            from PySide6.QtGui import QColor
-            # 深色主题下的高亮颜色 (文字高亮)
-            is_modified = material.get('is_modified', 0)
-            is_single = material.get('is_single_import', 0)
-            
-            if is_modified:
-                return QColor('#FFDD55') # 亮黄色文字 (修改过)
-            if is_single:
-                return QColor('#55FF55') # 亮绿色文字 (单独导入)
+            return self._rows[row][1]
         
         return None
 
@@ -272,8 +272,9 @@ class SamplerPanel(QFrame):
     def refresh_translations(self):
         """刷新翻译文本（语言切换时调用）"""
         # 标题和提示
-        if hasattr(self, 'sampler_title_label') and self.sampler_title_label:
-            self.sampler_title_label.setText("🖼 " + _('sampler_panel_title'))
+        title_label = getattr(self, 'sampler_title_label', None)
+        if title_label:
+            title_label.setText("🖼 " + _('sampler_panel_title'))
         self.hint_label.setText(_('sampler_panel_hint'))
         # 计数标签需要根据当前数据刷新
         if hasattr(self, 'table') and self.table.model():
@@ -350,7 +350,7 @@ def show_info_dialog(parent: QWidget, title: str, message: str, button_text: str
     msg.setText(message)
     msg.setIcon(QMessageBox.Icon.Information)
     
-    button_text = button_text or (_('ok') if _('ok') != 'ok' else "确定")
+    button_text = button_text or _('ok')
     ok_btn = msg.addButton(button_text, QMessageBox.ButtonRole.AcceptRole)
     apply_button_style(ok_btn, 'solid-blue')
     
@@ -364,7 +364,7 @@ def show_warning_dialog(parent: QWidget, title: str, message: str, button_text:
     msg.setText(message)
     msg.setIcon(QMessageBox.Icon.Warning)
     
-    button_text = button_text or (_('ok') if _('ok') != 'ok' else "确定")
+    button_text = button_text or _('ok')
     ok_btn = msg.addButton(button_text, QMessageBox.ButtonRole.AcceptRole)
     apply_button_style(ok_btn, 'glass')
     
@@ -378,7 +378,7 @@ def show_error_dialog(parent: QWidget, title: str, message: str, button_text: st
     msg.setText(message)
     msg.setIcon(QMessageBox.Icon.Critical)
     
-    button_text = button_text or (_('ok') if _('ok') != 'ok' else "确定")
+    button_text = button_text or _('ok')
     ok_btn = msg.addButton(button_text, QMessageBox.ButtonRole.AcceptRole)
     apply_button_style(ok_btn, 'danger')
     
@@ -438,3 +438,49 @@ def show_yes_no_cancel_dialog(
         return False
     else:
         return None
+
+
+class MessageDialogPool:
+    """
+    可复用的消息对话框池
+
+    同一父窗口下每种类型（信息/警告/错误）只创建一个 QMessageBox，
+    之后的调用只更新标题和内容再显示，适合批量流程中连续弹出的提示。
+    """
+
+    _KINDS = {
+        'info': (QMessageBox.Icon.Information, 'solid-blue'),
+        'warning': (QMessageBox.Icon.Warning, 'glass'),
+        'error': (QMessageBox.Icon.Critical, 'danger'),
+    }
+
+    def __init__(self, parent: QWidget):
+        self._parent = parent
+        self._dialogs = {}
+
+    def _get(self, kind: str) -> QMessageBox:
+        msg = self._dialogs.get(kind)
+        if msg is None:
+            icon, style = self._KINDS[kind]
+            msg = QMessageBox(self._parent)
+            msg.setIcon(icon)
+            ok_btn = msg.addButton(_('ok'), QMessageBox.ButtonRole.AcceptRole)
+            apply_button_style(ok_btn, style)
+            self._dialogs[kind] = msg
+        return msg
+
+    def show(self, kind: str, title: str, message: str):
+        """显示指定类型的消息对话框（模态，关闭后隐藏以便复用）"""
+        msg = self._get(kind)
+        msg.setWindowTitle(title)
+        msg.setText(message)
+        msg.exec()
+
+    def info(self, title: str, message: str):
+        self.show('info', title, message)
+
+    def warning(self, title: str, message: str):
+        self.show('warning', title, message)
+
+    def error(self, title: str, message: str):
+        self.show('error', title, message)
@@ -402,6 +402,27 @@ class ProgressTracker:
         return self.current >= self.total
 
 
+# 确认对话框的固定尺寸 (宽, 高)
+_CONFIRM_DIALOG_SIZE = (350, 140)
+
+
+def _center_tk_dialog(dialog, parent, width: int, height: int):
+    """
+    按已知尺寸居中 Tk 对话框
+    
+    对话框尺寸是固定的，直接用常量计算位置，无需 update_idletasks 强制布局
+    """
+    if parent:
+        # 相对于父窗口居中
+        x = parent.winfo_x() + (parent.winfo_width() - width) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - height) // 2
+    else:
+        # 屏幕居中
+        x = (dialog.winfo_screenwidth() - width) // 2
+        y = (dialog.winfo_screenheight() - height) // 2
+    dialog.geometry(f"{width}x{height}+{x}+{y}")
+
+
 def show_multilingual_confirmation(title: str, message: str, parent=None) -> bool:
     """
     显示多语言确认对话框（是/否）- 黑暗主题版本
@@ -442,26 +463,14 @@ def show_multilingual_confirmation(title: str, message: str, parent=None) -> boo
         dialog = tk.Toplevel(actual_parent)
         dialog.title(title)
         dialog.resizable(False, False)
+        
+        # 设置对话框大小和居中（在 grab_set 之前定位，避免可见的跳动）
+        _center_tk_dialog(dialog, actual_parent, *_CONFIRM_DIALOG_SIZE)
         dialog.grab_set()  # 模态对话框
         
         # 应用黑暗主题
         dialog.configure(bg=ModernDarkTheme.COLORS['bg_primary'])
         
-        # 设置对话框大小和居中
-        dialog.geometry("350x140")
-        if actual_parent:
-            # 相对于父窗口居中
-            actual_parent.update_idletasks()
-            x = actual_parent.winfo_x() + (actual_parent.winfo_width() // 2) - 175
-            y = actual_parent.winfo_y() + (actual_parent.winfo_height() // 2) - 70
-            dialog.geometry(f"350x140+{x}+{y}")
-        else:
-            # 屏幕居中
-            dialog.geometry("350x140+{}+{}".format(
-                dialog.winfo_screenwidth() // 2 - 175,
-                dialog.winfo_screenheight() // 2 - 70
-            ))
-        
         result = [False]  # 使用列表以便在嵌套函数中修改
         
         # 消息标签
@@ -589,26 +598,14 @@ def show_multilingual_okcancel(title: str, message: str, parent=None) -> bool:
         dialog = tk.Toplevel(actual_parent)
         dialog.title(title)
         dialog.resizable(False, False)
+        
+        # 设置对话框大小和居中（在 grab_set 之前定位，避免可见的跳动）
+        _center_tk_dialog(dialog, actual_parent, *_CONFIRM_DIALOG_SIZE)
         dialog.grab_set()  # 模态对话框
         
         # 应用黑暗主题
         dialog.configure(bg=ModernDarkTheme.COLORS['bg_primary'])
         
-        # 设置对话框大小和居中
-        dialog.geometry("350x140")
-        if actual_parent:
-            # 相对于父窗口居中
-            actual_parent.update_idletasks()
-            x = actual_parent.winfo_x() + (actual_parent.winfo_width() // 2) - 175
-            y = actual_parent.winfo_y() + (actual_parent.winfo_height() // 2) - 70
-            dialog.geometry(f"350x140+{x}+{y}")
-        else:
-            # 屏幕居中
-            dialog.geometry("350x140+{}+{}".format(
-                dialog.winfo_screenwidth() // 2 - 175,
-                dialog.winfo_screenheight() // 2 - 70
-            ))
-        
         result = [False]  # 使用列表以便在嵌套函数中修改
         
         # 消息标签
@@ -10,8 +10,10 @@
 
 import os
 import sys
+from functools import lru_cache
 
 
+@lru_cache(maxsize=None)
 def get_base_path() -> str:
     """
     获取应用程序基础路径（资源文件所在的根目录）
@@ -20,6 +22,8 @@ def get_base_path() -> str:
     - PyInstaller 打包后（onedir + contents_directory='internal'）：返回 internal 子目录
     - PyInstaller 打包后（onefile）：返回临时解压目录 _MEIPASS
     
+    进程运行期间不会改变，首次计算后缓存（图标、样式等路径会被频繁获取）
+    
     Returns:
         基础路径字符串
     """
@@ -44,6 +48,7 @@ def get_base_path() -> str:
         return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+@lru_cache(maxsize=None)
 def get_exe_dir() -> str:
     """
     获取可执行文件所在目录（用于用户数据存储）